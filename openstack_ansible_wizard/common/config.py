@@ -12,13 +12,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import inspect
+import os
 from pathlib import Path
+import threading
 from ruamel.yaml import YAML, YAMLError
+from ruamel.yaml.constructor import SafeConstructor
+from ruamel.yaml.nodes import MappingNode, ScalarNode
 
 from openstack_ansible_wizard.common.screens import WizardConfigScreen
 from openstack_ansible_wizard.screens import services
 
+_YAML_SUFFIXES = (".yml", ".yaml")
+_WIZARD_FILES = ("wizard.yml", "wizard.yaml")
+
+
+class _TaggedSafeConstructor(SafeConstructor):
+    """A safe constructor loading custom tagged values, like Ansible's !vault, as plain data."""
+
+
+def _construct_tagged(constructor: SafeConstructor, tag_suffix: str, node):
+    """Constructs a tagged node as its untagged scalar, mapping or sequence."""
+    if isinstance(node, ScalarNode):
+        return constructor.construct_scalar(node)
+    if isinstance(node, MappingNode):
+        return constructor.construct_mapping(node, deep=True)
+    return constructor.construct_sequence(node, deep=True)
+
+
+_TaggedSafeConstructor.add_multi_constructor("!", _construct_tagged)
+
+# Merged configs are only read, so they skip the round-trip bookkeeping, while legacy
+# files keep their comments when rewritten. The instances are shared by the screens
+# worker threads, so they are used under a lock.
+_YAML_LOCK = threading.Lock()
+_SAFE_YAML = YAML(typ="safe")
+_SAFE_YAML.Constructor = _TaggedSafeConstructor
+_ROUND_TRIP_YAML = YAML()
+_ROUND_TRIP_YAML.indent(mapping=2, sequence=4, offset=2)
+_ROUND_TRIP_YAML.explicit_start = True
+
+# Legacy files found to hold no managed keys, along with the mtime and size they were parsed at
+_LEGACY_WITHOUT_MANAGED_KEYS: dict[str, tuple[int, int]] = {}
+# Parsed service config files along with the mtime and size they were parsed at. Entries are
+# private snapshots, only handed out as deep copies, so callers editing nested values can't alter them.
+_PARSED_CACHE: dict[str, tuple[int, int, dict]] = {}
+
 
 def _get_managed_keys_for_service(service_name: str) -> set[str]:
     """Dynamically finds the managed keys for a given service by inspecting screen classes."""
@@ -30,6 +70,26 @@ def _get_managed_keys_for_service(service_name: str) -> set[str]:
     return set()
 
 
+def _list_yaml_files(directory: Path) -> list[Path]:
+    """Lists YAML files of a directory with a single scan, reusing the type cached in its entries."""
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries if entry.name.endswith(_YAML_SUFFIXES) and entry.is_file()]
+
+
+def _load_cached(path: Path) -> dict:
+    """Parses a YAML file into a fresh dict, re-using the previous parse while its mtime and size are unchanged."""
+    stat = path.stat()
+    cached = _PARSED_CACHE.get(str(path))
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[2])
+    # Read in one go, and outside of the lock, so other threads only wait for parsing
+    content = path.read_bytes()
+    with _YAML_LOCK:
+        data = _SAFE_YAML.load(content) or {}
+    _PARSED_CACHE[str(path)] = (stat.st_mtime_ns, stat.st_size, data)
+    return copy.deepcopy(data)
+
+
 def load_service_config(config_path: str, service_name: str) -> tuple[dict, str | None]:
     """Loads and merges configuration for a specific service from multiple YAML files.
 
@@ -43,10 +103,14 @@ def load_service_config(config_path: str, service_name: str) -> tuple[dict, str
     group_vars_path = Path(config_path) / "group_vars"
     service_dir_path = group_vars_path / service_name
     service_dir_path.mkdir(exist_ok=True)
+    try:
+        config_files = _list_yaml_files(service_dir_path)
+    except OSError as e:
+        return {}, f"Error reading {service_dir_path}: {e}"
 
     if service_name == "all":
         # For 'all', we treat all non-wizard YAML files in the directory as potential legacy sources.
-        legacy_files = [f for f in service_dir_path.glob("*.y*ml") if f.name not in ("wizard.yml", "wizard.yaml")]
+        legacy_files = [f for f in config_files if f.name not in _WIZARD_FILES]
     else:
         # Migrate legacy customer config files if they exist
         legacy_files = [
@@ -56,63 +120,67 @@ def load_service_config(config_path: str, service_name: str) -> tuple[dict, str
             group_vars_path / f"{service_name}_all.yaml",
         ]
 
-    yaml_loader = YAML()
-    yaml_writer = YAML()
-    yaml_writer.indent(mapping=2, sequence=4, offset=2)
-    yaml_writer.explicit_start = True
     managed_keys = _get_managed_keys_for_service(service_name)
     final_legacy_managed_config = {}
 
     for legacy_file in legacy_files:
-        if legacy_file.exists():
-            try:
-                with legacy_file.open('r') as f:
-                    data = yaml_loader.load(f) or {}
-
-                unmanaged_data = {}
-                file_managed_config = {}
-                for key, value in data.items():
-                    if key in managed_keys:
-                        file_managed_config[key] = value
-                    else:
-                        unmanaged_data[key] = value
-
-                # If there are no managed keys in the file, there's nothing to migrate.
-                if not file_managed_config:
-                    continue
-
-                if unmanaged_data:
-                    # Rewrite the file with only the unmanaged data.
-                    with legacy_file.open('w') as f:
-                        yaml_writer.dump(unmanaged_data, f)
+        try:
+            stat = legacy_file.stat()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            return {}, f"Error migrating legacy file {legacy_file.name}: {e}"
+        # Legacy files are often kept for their unmanaged keys, so unchanged ones are not parsed again
+        if _LEGACY_WITHOUT_MANAGED_KEYS.get(str(legacy_file)) == (stat.st_mtime_ns, stat.st_size):
+            continue
+        try:
+            content = legacy_file.read_bytes()
+            with _YAML_LOCK:
+                data = _ROUND_TRIP_YAML.load(content) or {}
+
+            unmanaged_data = {}
+            file_managed_config = {}
+            for key, value in data.items():
+                if key in managed_keys:
+                    file_managed_config[key] = value
                 else:
-                    # If the file only contained managed keys, it's now empty and can be removed.
-                    legacy_file.unlink()
-                # Add the managed keys from this file to the final collection
-                final_legacy_managed_config.update(file_managed_config)
-            except (IOError, OSError) as e:
-                return {}, f"Error migrating legacy file {legacy_file.name}: {e}"
+                    unmanaged_data[key] = value
+
+            # If there are no managed keys in the file, there's nothing to migrate.
+            if not file_managed_config:
+                _LEGACY_WITHOUT_MANAGED_KEYS[str(legacy_file)] = (stat.st_mtime_ns, stat.st_size)
+                continue
+
+            if unmanaged_data:
+                # Rewrite the file with only the unmanaged data.
+                with legacy_file.open('w') as f, _YAML_LOCK:
+                    _ROUND_TRIP_YAML.dump(unmanaged_data, f)
+            else:
+                # If the file only contained managed keys, it's now empty and can be removed.
+                legacy_file.unlink()
+                if legacy_file in config_files:
+                    config_files.remove(legacy_file)
+            # Add the managed keys from this file to the final collection
+            final_legacy_managed_config.update(file_managed_config)
+        except (IOError, OSError) as e:
+            return {}, f"Error migrating legacy file {legacy_file.name}: {e}"
+
+    if not config_files:
+        # Freshly created service directories have nothing to merge over the legacy values
+        return final_legacy_managed_config, None
 
     # Load all YAML files from the service-specific directory.
     # The loading order is alphabetical, which is generally fine.
-    merged_config = {}
-    yaml_loader = YAML()
+    # They are merged straight over the legacy managed values, which are a fresh dict. This ensures
+    # wizard.yml takes precedence, but legacy values are used as defaults if wizard.yml doesn't exist.
+    final_config = final_legacy_managed_config
     # Sort files to ensure a consistent merge order, with 'wizard.yml' loaded last.
-    config_files = sorted(service_dir_path.glob("*.y*ml"), key=lambda p: (p.name != 'wizard.yml', p.name))
+    config_files.sort(key=lambda p: (p.name == 'wizard.yml', p.name))
     for file in config_files:
-        if file.exists():
-            try:
-                with file.open() as f:
-                    data = yaml_loader.load(f) or {}
-                    merged_config.update(data)
-            except (YAMLError, IOError) as e:
-                return {}, f"Error loading {file.name}: {e}"
-
-    # The final config is the legacy managed values updated with anything loaded
-    # from the service directory. This ensures wizard.yml takes precedence,
-    # but legacy values are used as defaults if wizard.yml doesn't exist.
-    final_config = final_legacy_managed_config.copy()
-    final_config.update(merged_config)
+        try:
+            final_config.update(_load_cached(file))
+        except (YAMLError, IOError) as e:
+            return {}, f"Error loading {file.name}: {e}"
 
     return final_config, None
 
@@ -121,8 +189,10 @@ def save_service_config(config_path: str, service_name: str, data: dict) -> None
     """Saves configuration data to the wizard-specific YAML file."""
     save_path = Path(config_path) / "group_vars" / service_name / "wizard.yml"
     save_path.parent.mkdir(parents=True, exist_ok=True)
-    yaml = YAML()
-    yaml.indent(mapping=2, sequence=4, offset=2)
-    yaml.explicit_start = True
-    with save_path.open('w') as f:
-        yaml.dump(data, f)
+    # Saves from overlapping workers are serialized from truncating the file to caching what was written
+    with _YAML_LOCK:
+        with save_path.open('w') as f:
+            _ROUND_TRIP_YAML.dump(data, f)
+        # The next load gets back what was just written, so there is no need to parse it again
+        stat = save_path.stat()
+        _PARSED_CACHE[str(save_path)] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(data))
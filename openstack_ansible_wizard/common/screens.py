@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pathlib import Path
+import os
+import stat
 from textual.app import ComposeResult
 from textual.containers import Grid
 from textual.screen import ModalScreen, Screen
@@ -36,6 +37,14 @@ class ConfirmExitScreen(ModalScreen[bool]):
             message = "Are you sure you want to exit?"
         self.message = message
 
+    def set_message(self, message: str) -> None:
+        """Change the question asked, so that the screen can be reused."""
+        self.message = message or "Are you sure you want to exit?"
+        if self.is_mounted:
+            self.query_one("#confirm_question", Label).update(self.message)
+            # Auto focus the first button again, like on a freshly composed screen
+            self.set_focus(None)
+
     def compose(self) -> ComposeResult:
         yield Grid(
             Label(self.message, classes="title", id="confirm_question"),
@@ -72,11 +81,14 @@ class PathInputScreen(ModalScreen):
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the path input screen."""
+        # Kept to not query them again on every submission
+        self._path_input = Input(placeholder=f"e.g., /path/to/{self.path_type}", id="path_input")
+        self._message = Static("", id="path_input_message")
         yield Grid(
             Static(f"Enter Custom Path for {self.path_type}", classes="title", id="path_input_title"),
-            Input(placeholder=f"e.g., /path/to/{self.path_type}", id="path_input"),
+            self._path_input,
             Button("Submit Path", id="submit_path", variant="primary"),
-            Static("", id="path_input_message"),
+            self._message,
             id="select_path_dialog"
         )
 
@@ -84,17 +96,22 @@ class PathInputScreen(ModalScreen):
     @on(Button.Pressed, "#submit_path")
     def submit_path(self) -> None:
         """Processes the submitted path."""
-        path_input = self.query_one("#path_input", Input).value
-        message_widget = self.query_one("#path_input_message", Static)
+        path_input = self._path_input.value
+        message_widget = self._message
         if path_input:
-            p = Path(path_input)
-            if p.is_dir():
+            # A single stat tells both whether the path exists and whether it is a directory
+            try:
+                is_dir = stat.S_ISDIR(os.stat(path_input).st_mode)
+                exists = True
+            except (OSError, ValueError):
+                is_dir = exists = False
+            if is_dir:
                 if self.reversed:
                     message_widget.update(f"[red]Error:[/red] Path '{path_input}' already exist and is a directory.")
                 else:
                     message_widget.update(f"[green]Path '{path_input}' is a valid directory.[/green]")
                     self.dismiss(path_input)
-            elif p.exists() and self.reversed:
+            elif exists and self.reversed:
                 message_widget.update(f"[red]Error:[/red] Path '{path_input}' already exist")
             else:
                 if self.reversed:
@@ -113,6 +130,8 @@ class PathInputScreen(ModalScreen):
 
     def action_pop_screen(self) -> None:
         """Pops the current screen from the screen stack."""
+        # Paths rejected for their parent permissions are checked afresh next time
+        utils.clear_writable_cache()
         self.dismiss(None)
 
 
@@ -125,6 +144,8 @@ class WizardConfigScreen(Screen):
         ("s", "save_configs", "Save"),
     ]
 
+    _confirm_modal: ConfirmExitScreen | None = None
+
     @classmethod
     def get_managed_keys(cls) -> set[str]:
         """Returns a set of configuration keys managed by this screen."""
@@ -138,6 +159,23 @@ class WizardConfigScreen(Screen):
         """This method should be implemented by subclasses to handle saving."""
         pass
 
+    def _confirm_exit_modal(self, message: str) -> ConfirmExitScreen:
+        """Return the confirmation modal, installed so Textual keeps it composed between prompts."""
+        if self._confirm_modal is None:
+            self._confirm_modal = ConfirmExitScreen(message=message)
+            self.app.install_screen(self._confirm_modal, f"confirm-exit-{id(self)}")
+        else:
+            self._confirm_modal.set_message(message)
+        return self._confirm_modal
+
+    def on_unmount(self) -> None:
+        """Release the reused confirmation modal along with the screen."""
+        modal = self._confirm_modal
+        # On app exit the modal can still be open; the app then tears it down itself
+        if modal is not None and modal not in self.app.screen_stack:
+            self.app.uninstall_screen(modal)
+            modal.remove()
+
     def action_safe_quit(self) -> None:
         """Handle quit binding by safely popping the screen."""
         self.action_pop_screen(action="quit")
@@ -147,7 +185,7 @@ class WizardConfigScreen(Screen):
         """Pops the screen or exits the app, confirming if there are unsaved changes."""
         if self.has_unsaved_changes():
             message = "You have unsaved changes.\nAre you sure you want to exit?"
-            proceed = await self.app.push_screen_wait(ConfirmExitScreen(message=message))
+            proceed = await self.app.push_screen_wait(self._confirm_exit_modal(message))
             if not proceed:
                 return
 
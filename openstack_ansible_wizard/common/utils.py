@@ -12,27 +12,91 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import json
 import os
+from pathlib import Path
+import time
 import urllib.request as request
 from urllib.error import URLError, HTTPError
 import yaml
 
+# How long (in seconds) a directory writability check result is re-used
+WRITABLE_CACHE_TTL = 2
+WRITABLE_CACHE_SIZE = 64
+
+_WRITABLE_CACHE: dict[tuple[str, int], tuple[float, bool]] = {}
+
+# Where fetched releases metadata is kept along with its ETag/Last-Modified headers
+RELEASES_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'), 'openstack-ansible-wizard')
+
 
 def path_writable(path: str, parent: bool = False) -> bool:
     """Identify if current or parent part is writable for the script"""
     if parent:
         path = os.path.dirname(path)
 
-    return os.access(path, os.W_OK)
+    # Paths are checked on every keystroke, while their (parent) directory rarely changes
+    key = (path, os.geteuid())
+    cached = _WRITABLE_CACHE.get(key)
+    now = time.monotonic()
+    if cached and now - cached[0] < WRITABLE_CACHE_TTL:
+        return cached[1]
+    writable = os.access(path, os.W_OK)
+    if len(_WRITABLE_CACHE) >= WRITABLE_CACHE_SIZE:
+        _WRITABLE_CACHE.clear()
+    _WRITABLE_CACHE[key] = (now, writable)
+    return writable
+
+
+def clear_writable_cache() -> None:
+    """Forget cached writability checks, once permissions may have been fixed by the user"""
+    _WRITABLE_CACHE.clear()
+
+
+def fetch_cached(uri: str, cache_dir: Path = RELEASES_CACHE_DIR) -> str:
+    """Fetch uri content, using a conditional request against the copy cached on disk
+
+    When the server replies with 304 Not Modified, the cached copy is returned
+    without downloading it again. Errors are raised as by urlopen.
+    """
+    cache_file = cache_dir / f"{hashlib.sha256(uri.encode()).hexdigest()}.json"
+    try:
+        cached = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        cached = {}
+
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+    try:
+        with request.urlopen(request.Request(uri, headers=headers)) as response:
+            body = response.read().decode()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+    except HTTPError as e:
+        if e.code == 304 and 'body' in cached:
+            return cached['body']
+        raise
+
+    if etag or last_modified:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({'etag': etag, 'last_modified': last_modified, 'body': body}))
+        except OSError:
+            # Caching is an optimization only, so an unwritable cache is not an error
+            pass
+    return body
 
 
-def get_openstack_series(releases_uri: str) -> list:
+def get_openstack_series(releases_uri: str, cache_dir: Path = RELEASES_CACHE_DIR) -> list:
     """Fetch and parse currently maintained releases from upstream repository"""
 
     uri = os.path.join(releases_uri, 'data/series_status.yaml')
     try:
-        with request.urlopen(uri) as response:
-            openstack_series = yaml.load(response, Loader=yaml.Loader)
+        openstack_series = yaml.load(fetch_cached(uri, cache_dir), Loader=yaml.Loader)
     except HTTPError as e:
         print('The server couldn\'t fulfill the request.')
         print('Error code: ', e.code)
@@ -46,12 +110,11 @@ def get_openstack_series(releases_uri: str) -> list:
     return active_series
 
 
-def get_osa_versions(releases_uri: str, release: str) -> list:
+def get_osa_versions(releases_uri: str, release: str, cache_dir: Path = RELEASES_CACHE_DIR) -> list:
     """Fetch and parse available versions for given release"""
     uri = os.path.join(releases_uri, f'deliverables/{release}/openstack-ansible.yaml')
     try:
-        with request.urlopen(uri) as response:
-            osa_deliverable = yaml.load(response, Loader=yaml.Loader)
+        osa_deliverable = yaml.load(fetch_cached(uri, cache_dir), Loader=yaml.Loader)
     except HTTPError as e:
         print('The server couldn\'t fulfill the request.')
         print('Error code: ', e.code)
@@ -0,0 +1,44 @@
+# Copyright 2025, Adria Cloud Services.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from textual import events
+from textual.message import Message
+from textual.widgets import DataTable
+from textual.widgets.data_table import RowKey
+
+
+class DoubleClickDataTable(DataTable):
+    """A data table that reports rows double clicked, using Textual's chained clicks."""
+
+    class RowDoubleClicked(Message):
+        """Posted when a row is double clicked, after its RowSelected message."""
+
+        def __init__(self, data_table: "DoubleClickDataTable", row_key: RowKey) -> None:
+            super().__init__()
+            self.data_table = data_table
+            self.row_key = row_key
+
+        @property
+        def control(self) -> "DoubleClickDataTable":
+            return self.data_table
+
+    async def _on_click(self, event: events.Click) -> None:
+        """Handle clicks as usual, then report the second click of a chain on a row."""
+        await super()._on_click(event)
+        meta = event.style.meta
+        if event.chain != 2 or not self.show_cursor or self.cursor_type == "none":
+            return
+        # Header and row label clicks carry a negative index
+        if meta.get("row", -1) >= 0 and meta.get("column", -1) >= 0:
+            self.post_message(self.RowDoubleClicked(self, self.ordered_rows[meta["row"]].key))
@@ -0,0 +1,79 @@
+# Copyright 2025, Adria Cloud Services.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+from textual.widgets import DirectoryTree
+from textual.widgets.directory_tree import DirEntry
+from textual.widgets.tree import TreeNode
+from textual.worker import Worker
+
+
+class FastDirectoryTree(DirectoryTree):
+    """A directory tree listing directories with os.scandir, re-using its cached entry types."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._is_dir_cache: dict[Path, bool] = {}
+
+    def _safe_is_dir(self, path: Path) -> bool:
+        """Checks if a path is a directory, using the type recorded while listing its parent."""
+        is_dir = self._is_dir_cache.get(path)
+        if is_dir is None:
+            is_dir = super()._safe_is_dir(path)
+        return is_dir
+
+    def _directory_content(self, location: Path, worker: Worker) -> Iterator[Path]:
+        """Yields the entries of a directory, recording whether each of them is a directory."""
+        try:
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if worker.is_cancelled:
+                        break
+                    path = Path(entry.path)
+                    try:
+                        # Symlinks are followed to keep linked directories expandable
+                        self._is_dir_cache[path] = entry.is_dir()
+                    except OSError:
+                        self._is_dir_cache[path] = False
+                    yield path
+        except PermissionError:
+            pass
+
+    def find_node(self, path: Path) -> TreeNode[DirEntry] | None:
+        """Returns the loaded node of the path, walking down only the directories leading to it."""
+        node = self.root
+        root_path = node.data.path
+        if path in (root_path, root_path.expanduser().resolve()):
+            return node
+        while True:
+            for child in node.children:
+                child_path = child.data.path
+                if child_path == path:
+                    return child
+                if child_path in path.parents:
+                    node = child
+                    break
+            else:
+                return None
+
+    def reload_path(self, path: Path) -> None:
+        """Reloads only the node of the given directory, or the whole tree if it is not loaded."""
+        node = self.find_node(path)
+        if node is None:
+            self.reload()
+        else:
+            self.reload_node(node)
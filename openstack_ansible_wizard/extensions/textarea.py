@@ -13,9 +13,26 @@
 # limitations under the License.
 from textual import events
 from textual.widgets import TextArea
+from textual.widgets.text_area import DocumentBase, DocumentNavigator, WrappedDocument
 
 
 class YAMLTextArea(TextArea):
+    def load_document(self, document: DocumentBase) -> None:
+        """Load an already parsed document, skipping the syntax tree build of load_text.
+
+        The document must have been created by this text area (i.e. taken from
+        its `document` attribute), so it is parsed for the same language.
+        """
+        self.history.clear()
+        self.document = document
+        self.wrapped_document = WrappedDocument(document, tab_width=self.indent_width)
+        self.navigator = DocumentNavigator(self.wrapped_document)
+        self._build_highlight_map()
+        self.move_cursor((0, 0))
+        self._rewrap_and_refresh_virtual_size()
+        self.post_message(self.Changed(self).set_sender(self))
+        self.update_suggestion()
+
     def _on_key(self, event: events.Key) -> None:
         if event.character == "(":
             self.insert("()")
@@ -14,10 +14,14 @@
 
 import asyncio
 from pathlib import Path
+import time
+from typing import Callable
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Container, HorizontalGroup, Grid
 from textual import on, work
+from textual.worker import get_current_worker
 from textual.widgets import Header, Footer, Static, Select, Button, Log
 from textual.screen import Screen, ModalScreen
 
@@ -30,6 +34,47 @@ from openstack_ansible_wizard.screens.git import GitCloneScreen
 
 OSA_REPOSITORY = "https://opendev.org/openstack/openstack-ansible"
 RELEASES_REPOSITORY = "https://opendev.org/openstack/releases/raw"
+# How long (in seconds) fetched releases metadata is considered fresh
+RELEASES_CACHE_TTL = 300
+# Delay (in seconds) to coalesce quick OpenStack release selection changes
+RELEASE_SELECT_DEBOUNCE = 0.15
+
+_RELEASES_CACHE: dict[tuple[str, ...], tuple[float, list]] = {}
+
+# Clone path status prefixes, parsed once instead of on every status update
+_OK_PREFIX = Text.from_markup("[green]✓[/green] ")
+_BAD_PREFIX = Text.from_markup("[red]✗[/red] ")
+
+
+def _cached_releases(key: tuple[str, ...], fetcher: Callable[[], list]) -> list:
+    """Return releases metadata for the key, calling fetcher only if cache is cold or stale
+
+    Failed (empty) fetches are not cached, so they are retried on the next call.
+    """
+    cached = _RELEASES_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < RELEASES_CACHE_TTL:
+        return cached[1]
+    data = fetcher()
+    if data:
+        _RELEASES_CACHE[key] = (time.monotonic(), data)
+    return data
+
+
+def _probe_clone_path(clone_path: str) -> str:
+    """Classifies the clone path, performing the (potentially slow) filesystem checks
+
+    Returns "osa" for an existing OpenStack-Ansible directory, "exists" for any other
+    existing path, "not_writable" when its parent is not writable, or "destination"
+    when the repository can be cloned into it.
+    """
+    path = Path(clone_path)
+    if path.exists():
+        if (path / 'osa_toolkit' / 'generate.py').is_file():
+            return "osa"
+        return "exists"
+    if not utils.path_writable(clone_path, parent=True):
+        return "not_writable"
+    return "destination"
 
 
 class CloneOSAScreen(Screen):
@@ -40,7 +85,7 @@ class CloneOSAScreen(Screen):
         ("p", "change_path", "Change path"),
     ]
 
-    clone_destination_text = reactive("")
+    clone_destination_text: reactive[str | Text] = reactive("")
     repository_check_text = reactive("")
     clone_path = reactive("")
 
@@ -54,6 +99,12 @@ class CloneOSAScreen(Screen):
         self.clone_version = int()
         self.initial_clone_version = int()
         self.force_clone = False
+        self.selected_series: str | None = None
+        self._handled_osa_version: str | None = None
+        self._versions_loaded = False
+        self._path_state: tuple[str, str] | None = None
+        self._release_options: tuple[tuple[str, str], ...] = ()
+        self._osa_options_cache: dict[str, tuple[tuple[str, str], ...]] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the path input screen."""
@@ -76,66 +127,125 @@ class CloneOSAScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when the screen is mounted."""
+        self._clone_destination = self.query_one("#clone_destination", Static)
+        self._repository_check = self.query_one("#repository_check", Static)
+        self._openstack_version_select = self.query_one("#openstack-version", Select)
+        self._osa_version_select = self.query_one("#openstack-ansible-version", Select)
+        self._clone_button = self.query_one("#clone_repo", Button)
         self.check_clone()
 
     def on_screen_resume(self) -> None:
         """Called when this screen becomes the active screen again."""
-        self.check_clone()
+        self.refresh_path_status()
 
-    def watch_clone_destination_text(self):
-        self.query_one("#clone_destination", Static).update(self.clone_destination_text)
+    def watch_clone_destination_text(self, text: str | Text) -> None:
+        self._clone_destination.update(text)
 
-    def watch_repository_check_text(self):
-        self.query_one("#repository_check", Static).update(self.repository_check_text)
+    def watch_repository_check_text(self, text: str) -> None:
+        self._repository_check.update(text)
 
     def check_clone(self) -> None:
-        self.add_class('no-version-fetch')
-        self.add_class('no-version-selected')
-        self.add_class('no-osa-version-selected')
-        self.add_class('no-clone-detected')
-
-        if self.check_path_is_clone_destination():
-            self.repository_check_text = 'Checking for currently maintained releases'
-            self.fetch_openstack_releases()
-            self.repository_check_text = ''
-
-        elif self.check_path_is_osa_dir():
-            osa_version = cm_git.get_git_version(self.clone_path)
-            osa_version = self.initial_clone_version = cm_git.get_git_version(self.clone_path)
-            self.clone_version = osa_version
+        # Only called on mount and when the clone path changed, so always start over
+        self._reset_version_selection()
+        self.check_clone_path(fetch_versions=True)
+        # self.dismiss(self.clone_path)
+
+    def _reset_version_selection(self) -> None:
+        """Hides the version selection and Clone button until the clone path is probed again."""
+        # Releases are re-shown from the already fetched options, so no new request is made
+        self.add_class('no-version-fetch', 'no-version-selected', 'no-osa-version-selected', 'no-clone-detected')
+        self._handled_osa_version = None
+        self.selected_series = None
+        self._versions_loaded = False
+
+    def refresh_path_status(self) -> None:
+        """Re-checks the clone path only, keeping already fetched versions and selections."""
+        self.check_clone_path(fetch_versions=False)
+
+    @work(thread=True)
+    def check_clone_path(self, fetch_versions: bool) -> None:
+        """Probes the clone path off the UI thread, as filesystem and git calls may block."""
+        clone_path = self.clone_path
+        state = _probe_clone_path(clone_path)
+        osa_version = cm_git.get_git_version(clone_path) if state == "osa" else None
+        self.app.call_from_thread(self._apply_path_state, clone_path, state, osa_version, fetch_versions)
+
+    def _apply_path_state(self, clone_path: str, state: str, osa_version: str | None, fetch_versions: bool) -> None:
+        if clone_path != self.clone_path:
+            # Path was changed while being probed, so the result is outdated
+            return
+        previous_state = self._path_state
+        self._path_state = (clone_path, state)
+        if not fetch_versions and previous_state != self._path_state:
+            # The path changed while the screen was away, e.g. it was cloned, so start over like on first entry
+            self._reset_version_selection()
+            fetch_versions = True
+
+        if state == "destination":
+            self.clone_destination_text = _OK_PREFIX + Text(f"{clone_path} can be used as clone destination.")
+            if fetch_versions and not self._versions_loaded:
+                self.fetch_openstack_releases()
+        elif state == "osa":
+            self.clone_destination_text = _OK_PREFIX + Text(f"{clone_path} is a valid OpenStack-Ansible directory.")
+            self.clone_version = self.initial_clone_version = osa_version
             self.repository_check_text = f'Detected OpenStack-Ansible version: {osa_version}'
             self.remove_class('no-clone-detected')
-        # self.dismiss(self.clone_path)
+        elif state == "exists":
+            self.clone_destination_text = _BAD_PREFIX + Text(
+                f"{clone_path} already exist. Select a different clone path by pressing 'p'")
+        else:
+            self.clone_destination_text = _BAD_PREFIX + Text(
+                f"{clone_path} is not writtable. Select a different clone path by pressing 'p'")
 
     @work(thread=True)
     def fetch_openstack_releases(self) -> None:
         self.repository_check_text = '[yellow]Checking for currently maintained releases[/yellow]'
-        releases = utils.get_openstack_series(RELEASES_REPOSITORY)
-        if len(releases) > 0:
-            openstack_versions_widget = self.query_one("#openstack-version", Select)
-            openstack_versions_widget.disabled = False
-            openstack_versions_widget.set_options(
+        if not self._release_options:
+            releases = _cached_releases(
+                (RELEASES_REPOSITORY,),
+                lambda: utils.get_openstack_series(RELEASES_REPOSITORY)
+            )
+            self._release_options = tuple(
                 (f"{release['release-id']} ({release['name']})", release['name']) for release in releases
             )
+        if self._release_options:
+            self._openstack_version_select.disabled = False
+            self._openstack_version_select.set_options(self._release_options)
             self.remove_class('no-version-fetch')
             self.repository_check_text = ""
+            self._versions_loaded = True
 
         else:
             self.repository_check_text = '[red]Failed to fetch currently supported OpenStack releases[/red]'
 
-    @work(thread=True)
+    @work(thread=True, exclusive=True, group="osa-versions-fetch")
     @on(Select.Changed, '#openstack-version')
     def fetch_osa_releases(self, event: Select.Changed) -> None:
-        if event.value == Select.BLANK:
+        if event.value == Select.BLANK or event.value == self.selected_series:
+            return
+        # Newer selections cancel this worker, so only the latest one gets fetched
+        time.sleep(RELEASE_SELECT_DEBOUNCE)
+        worker = get_current_worker()
+        if worker.is_cancelled:
             return
         self.repository_check_text = f"[yellow]Fetching versions for {event.value}...[/yellow]"
-        self.selected_series = event.value
-        versions = utils.get_osa_versions(RELEASES_REPOSITORY, event.value)
-        if versions:
-            osa_versions_widget = self.query_one("#openstack-ansible-version", Select)
+        options = self._osa_options_cache.get(event.value)
+        if options is None:
+            versions = _cached_releases(
+                (RELEASES_REPOSITORY, event.value),
+                lambda: utils.get_osa_versions(RELEASES_REPOSITORY, event.value)
+            )
+            options = tuple((version, version) for version in versions)
+            if options:
+                self._osa_options_cache[event.value] = options
+        if worker.is_cancelled:
+            return
+        if options:
+            # Only remember the series once fetched, so a failed fetch is retried on re-selection
+            self.selected_series = event.value
             self.remove_class('no-version-selected')
-            osa_versions_widget.set_options((version, version) for version in versions)
-            osa_versions_widget.disabled = False
+            self._osa_version_select.set_options(options)
+            self._osa_version_select.disabled = False
             self.repository_check_text = ""
         else:
             self.repository_check_text = "[red]Unable to fetch OpenStack-Ansible versions " \
@@ -143,21 +253,19 @@ class CloneOSAScreen(Screen):
 
     @on(Select.Changed, '#openstack-ansible-version')
     def enable_clone_button(self, event: Select.Changed) -> None:
-        if event.value == Select.BLANK:
+        if event.value == Select.BLANK or event.value == self._handled_osa_version:
             return
-        clone_repo_button_widget = self.query_one("#clone_repo", Button)
+        self._handled_osa_version = event.value
         self.remove_class('no-osa-version-selected')
-        if self.check_path_is_clone_destination():
-            clone_repo_button_widget = self.query_one("#clone_repo", Button)
         if self.force_clone:
-            clone_repo_button_widget.label = "Re-clone"
-            clone_repo_button_widget.variant = "error"
+            self._clone_button.label = "Re-clone"
+            self._clone_button.variant = "error"
         if self.check_path_is_clone_destination() or self.initial_clone_version != event.value:
-            clone_repo_button_widget.disabled = False
+            self._clone_button.disabled = False
             self.clone_version = event.value
             self.repository_check_text = ""
         elif self.initial_clone_version == event.value:
-            clone_repo_button_widget.disabled = True
+            self._clone_button.disabled = True
             self.repository_check_text = (
                 f"[yellow]Version {event.value} is already checked out. "
                 "Select a different version to re-clone.[/yellow]"
@@ -177,10 +285,9 @@ class CloneOSAScreen(Screen):
     @on(Button.Pressed, "#change_version")
     def on_change_version_pressed(self) -> None:
         """Shows the version selection widgets to allow cloning a different version."""
-        self.repository_check_text = 'Checking for currently maintained releases'
         self.force_clone = True
+        self._handled_osa_version = None
         self.fetch_openstack_releases()
-        self.repository_check_text = ''
 
     @on(Button.Pressed, "#bootstrap_osa")
     async def action_bootstrap_osa(self) -> None:
@@ -191,28 +298,10 @@ class CloneOSAScreen(Screen):
         )
 
     def check_path_is_clone_destination(self) -> bool:
-        path = Path(self.clone_path)
-        if path.exists():
-            if not Path(f'{self.clone_path}/osa_toolkit/generate.py').exists():
-                self.clone_destination_text = f"[red]✗[/red] {self.clone_path} already exist. " \
-                    "Select a different clone path by pressing 'p'"
-            return False
-        elif not utils.path_writable(path, parent=True):
-            self.clone_destination_text = f"[red]✗[/red] {self.clone_path} is not writtable. " \
-                "Select a different clone path by pressing 'p'"
-            return False
-        else:
-            self.clone_destination_text = f"[green]✓[/green] {self.clone_path} can be used as clone destination."
-            return True
-
-    def check_path_is_osa_dir(self) -> bool:
-        path = Path(self.clone_path)
-        if path.exists():
-            if Path(f'{self.clone_path}/osa_toolkit/generate.py').is_file():
-                self.clone_destination_text = \
-                    f"[green]✓[/green] {self.clone_path} is a valid OpenStack-Ansible directory."
-                return True
-        return False
+        """Returns whether the clone path can be cloned into, re-using the last probe of the same path."""
+        if self._path_state is None or self._path_state[0] != self.clone_path:
+            self._path_state = (self.clone_path, _probe_clone_path(self.clone_path))
+        return self._path_state[1] == "destination"
 
     @work
     async def action_change_path(self) -> None:
@@ -220,7 +309,7 @@ class CloneOSAScreen(Screen):
         custom_osa_path_resp = await self.app.push_screen_wait(
             PathInputScreen(path_type="openstack-ansible", reversed_checks=True)
         )
-        if custom_osa_path_resp:
+        if custom_osa_path_resp and custom_osa_path_resp != self.clone_path:
             self.clone_path = custom_osa_path_resp
             self.check_clone()
 
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import os
+from collections import OrderedDict
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -21,9 +24,26 @@ from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets.tree import TreeNode
 from textual.widgets import Header, Footer, Button, Static, DirectoryTree, Input, RadioSet, RadioButton
-from openstack_ansible_wizard.common.screens import ConfirmExitScreen, WizardConfigScreen
+from textual.widgets.text_area import DocumentBase
+from openstack_ansible_wizard.common.screens import WizardConfigScreen
+from openstack_ansible_wizard.extensions.directory_tree import FastDirectoryTree
 from openstack_ansible_wizard.extensions.textarea import YAMLTextArea
 
+# Maximum amount of files which content is kept in memory by the editor
+FILE_CACHE_SIZE = 16
+# Files bigger than this (in bytes) are read in chunks of this size, reporting progress
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+# Editor syntax themes used for dark and light application themes
+_DARK_THEME = "vscode_dark"
+_LIGHT_THEME = "github_light"
+
+
+def _editor_theme(dark: bool) -> str:
+    """Returns the editor syntax theme matching a dark or light application theme."""
+    return _DARK_THEME if dark else _LIGHT_THEME
+
 
 class FileBrowserEditorScreen(WizardConfigScreen):
     """A screen displaying a directory tree and a text editor."""
@@ -40,20 +60,17 @@ class FileBrowserEditorScreen(WizardConfigScreen):
         self.initial_path = initial_path
         self.original_content: str | None = None
         self._ignore_selection_change = False
-
-    @staticmethod
-    def _editor_theme(current_theme):
-        if current_theme.dark:
-            return "vscode_dark"
-        else:
-            return "github_light"
+        self._editor_theme_name: str | None = None
+        self._file_cache: OrderedDict[Path, tuple[int, str]] = OrderedDict()
+        self._loaded_path: Path | None = None
+        self._documents: OrderedDict[Path, DocumentBase] = OrderedDict()
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the file browser/editor screen."""
         yield Header()
         with HorizontalGroup(classes="editor-layout"):
             with VerticalScroll(classes="sidebar"):
-                yield DirectoryTree(self.initial_path, id="file_tree")
+                yield FastDirectoryTree(self.initial_path, id="file_tree")
             with VerticalScroll(classes="main-content"):
                 yield Static("Select a file from the tree to edit.", id="editor_status")
                 yield YAMLTextArea.code_editor(id="text_editor", language="yaml", show_line_numbers=True)
@@ -65,14 +82,28 @@ class FileBrowserEditorScreen(WizardConfigScreen):
 
     def on_mount(self) -> None:
         """Called when the screen is mounted."""
-        self.add_class("no-file")
-        editor = self.query_one("#text_editor", YAMLTextArea)
-        editor.disabled = True  # Disable until a file is loaded
-        editor.theme = self._editor_theme(self.app.current_theme)
-        self.query_one("#save_button", Button).disabled = True
-        self.query_one("#delete_button", Button).disabled = True
+        self._editor = self.query_one("#text_editor", YAMLTextArea)
+        self._save_button = self.query_one("#save_button", Button)
+        self._delete_button = self.query_one("#delete_button", Button)
+        self._status_message = self.query_one("#editor_status", Static)
+        self._file_tree = self.query_one("#file_tree", FastDirectoryTree)
 
-    @work
+        self.add_class("no-file")
+        self._editor.disabled = True  # Disable until a file is loaded
+        self.apply_editor_theme()
+        self.watch(self.app, "theme", self.apply_editor_theme, init=False)
+        self._save_button.disabled = True
+        self._delete_button.disabled = True
+
+    def apply_editor_theme(self) -> None:
+        """Sets the editor theme from the app theme, only if it has changed."""
+        theme_name = _editor_theme(self.app.current_theme.dark)
+        # Theme names are always one of the module constants, so identity is enough
+        if theme_name is not self._editor_theme_name:
+            self._editor.theme = theme_name
+            self._editor_theme_name = theme_name
+
+    @work(exclusive=True, group="editor-load")
     async def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         """Handles selection of a file in the DirectoryTree, confirming if there are unsaved changes."""
         if self._ignore_selection_change:
@@ -83,33 +114,37 @@ class FileBrowserEditorScreen(WizardConfigScreen):
         if not await self._handle_unsaved_changes():
             return
 
-        self.selected_path = event.path
-        editor = self.query_one("#text_editor", YAMLTextArea)
-        save_button = self.query_one("#save_button", Button)
-        delete_button = self.query_one("#delete_button", Button)
-        status_message = self.query_one("#editor_status", Static)
+        path = self.selected_path = event.path
         self.remove_class("directory-selected")
+        self._status_message.update(f"Loading: [yellow]{path}[/yellow]")
 
         try:
-            with open(self.selected_path, "r") as f:
-                content = f.read()
+            content = await asyncio.to_thread(self._read_file, path)
+            if self.selected_path != path:
+                # A newer selection took over while this file was being read
+                return
             self.original_content = content
-            editor.load_text(content)
-            editor.disabled = False
-            save_button.disabled = False
-            delete_button.label = "Delete File"
-            delete_button.disabled = False
+            # Re-selecting the file which is already loaded should not re-parse it
+            if self._loaded_path != path or self._editor.text != content:
+                self._load_editor_content(path, content)
+            self._editor.disabled = False
+            self._save_button.disabled = False
+            self._delete_button.label = "Delete File"
+            self._delete_button.disabled = False
             self.remove_class("no-file")
-            status_message.update(f"Editing: [green]{self.selected_path}[/green]")
+            self._status_message.update(f"Editing: [green]{path}[/green]")
         except Exception as e:
+            if self.selected_path != path:
+                return
             self.original_content = None
-            editor.load_text(f"Could not open file: {e}")
-            editor.disabled = True
-            save_button.disabled = True
-            delete_button.disabled = True
+            self._editor.load_text(f"Could not open file: {e}")
+            self._loaded_path = None
+            self._editor.disabled = True
+            self._save_button.disabled = True
+            self._delete_button.disabled = True
             self.add_class("no-file")
-            status_message.update(f"[red]Error:[/red] Could not open {self.selected_path}")
-            self.log(f"Error opening file {self.selected_path}: {e}")
+            self._status_message.update(f"[red]Error:[/red] Could not open {path}")
+            self.log(f"Error opening file {path}: {e}")
 
     @work
     async def on_directory_tree_directory_selected(self, event: DirectoryTree.DirectorySelected) -> None:
@@ -123,37 +158,33 @@ class FileBrowserEditorScreen(WizardConfigScreen):
             return
 
         self.selected_path = event.path
-        editor = self.query_one("#text_editor", YAMLTextArea)
-        save_button = self.query_one("#save_button", Button)
-        delete_button = self.query_one("#delete_button", Button)
-        status_message = self.query_one("#editor_status", Static)
 
         self.original_content = None
-        editor.load_text("")
-        editor.disabled = True
-        save_button.disabled = True
-        delete_button.label = "Delete Directory"
-        delete_button.disabled = False
+        self._editor.load_text("")
+        self._loaded_path = None
+        self._editor.disabled = True
+        self._save_button.disabled = True
+        self._delete_button.label = "Delete Directory"
+        self._delete_button.disabled = False
         self.add_class("no-file")
         self.add_class("directory-selected")
-        status_message.update(f"Selected directory: [green]{self.selected_path}[/green]")
+        self._status_message.update(f"Selected directory: [green]{self.selected_path}[/green]")
 
     @on(Button.Pressed, "#save_button")
-    def action_save_configs(self) -> None:
+    async def action_save_configs(self) -> None:
         """Saves the current content of the editor to the file."""
         if self.selected_path and self.selected_path.is_file():
-            editor = self.query_one("#text_editor", YAMLTextArea)
-            status_message = self.query_one("#editor_status", Static)
+            content = self._editor.text
             try:
-                with open(self.selected_path, "w") as f:
-                    f.write(editor.text)
-                self.original_content = editor.text  # Update original content on save
-                status_message.update(f"[green]File saved successfully:[/green] {self.selected_path}")
+                self._file_cache.pop(self.selected_path, None)
+                await asyncio.to_thread(self.selected_path.write_text, content)
+                self.original_content = content  # Update original content on save
+                self._status_message.update(f"[green]File saved successfully:[/green] {self.selected_path}")
             except Exception as e:
-                status_message.update(f"[red]Error saving file:[/red] {e}")
+                self._status_message.update(f"[red]Error saving file:[/red] {e}")
                 self.log(f"Error saving file {self.selected_path}: {e}")
         else:
-            self.query_one("#editor_status", Static).update("[yellow]No file selected to save.[/yellow]")
+            self._status_message.update("[yellow]No file selected to save.[/yellow]")
 
     @work
     @on(Button.Pressed, "#new_button")
@@ -166,71 +197,118 @@ class FileBrowserEditorScreen(WizardConfigScreen):
             base_path = self.selected_path.parent
 
         result = await self.app.push_screen_wait(CreateNewEntryScreen(base_path=Path(base_path)))
-        status_message = self.query_one("#editor_status", Static)
         self.log(f"creation result is {result}")
         if result:
             name, entry_type = result
             new_path = Path(base_path) / name
-            status_message.update(
+            self._status_message.update(
                 f"[green]Successfully created {entry_type}:[/green] {new_path}")
-            self.query_one("#file_tree", DirectoryTree).reload()
+            self._file_tree.reload_path(Path(base_path))
         else:
-            status_message.update("[yellow]New entry creation cancelled.[/yellow]")
+            self._status_message.update("[yellow]New entry creation cancelled.[/yellow]")
 
     @work
     @on(Button.Pressed, "#delete_button")
     async def action_delete_file(self) -> None:
         """Deletes the currently selected file after confirmation."""
         if not self.selected_path:
-            self.query_one("#editor_status", Static).update("[yellow]No file or directory selected to delete.[/yellow]")
+            self._status_message.update("[yellow]No file or directory selected to delete.[/yellow]")
             return
 
         confirm_message = f"Are you sure you want to delete '{self.selected_path.name}'?"
-        confirmed = await self.app.push_screen_wait(ConfirmExitScreen(confirm_message))
+        confirmed = await self.app.push_screen_wait(self._confirm_exit_modal(confirm_message))
 
-        status_message = self.query_one("#editor_status", Static)
         if confirmed:
+            parent_path = self.selected_path.parent
             try:
                 # Check if it's a file or directory before unlinking (files) or rmdir (empty dirs)
                 if self.selected_path.is_file():
                     self.selected_path.unlink()
-                    status_message.update(f"[green]File deleted successfully:[/green] {self.selected_path.name}")
+                    self._status_message.update(f"[green]File deleted successfully:[/green] {self.selected_path.name}")
                 elif self.selected_path.is_dir():
                     # For a directory, it must be empty to be deleted with rmdir()
                     self.selected_path.rmdir()
-                    status_message.update(
+                    self._status_message.update(
                         f"[green]Directory deleted successfully:[/green] {self.selected_path.name}")
                 else:
-                    status_message.update(f"[red]Error:[/red] Cannot delete '{self.selected_path.name}'."
-                                          "Not a file or empty directory.")
+                    self._status_message.update(f"[red]Error:[/red] Cannot delete '{self.selected_path.name}'."
+                                                "Not a file or empty directory.")
                     return
 
+                self._file_cache.pop(self.selected_path, None)
+                self._documents.pop(self.selected_path, None)
                 # Clear editor and disable buttons as the file is gone
-                editor = self.query_one("#text_editor", YAMLTextArea)
-                editor.load_text("")
-                editor.disabled = True
-                self.query_one("#save_button", Button).disabled = True
-                delete_button = self.query_one("#delete_button", Button)
-                delete_button.disabled = True
-                delete_button.label = "Delete"
+                self._editor.load_text("")
+                self._loaded_path = None
+                self._editor.disabled = True
+                self._save_button.disabled = True
+                self._delete_button.disabled = True
+                self._delete_button.label = "Delete"
                 self.remove_class("directory-selected")
                 self.add_class("no-file")
                 self.selected_path = None  # Clear the current file selection
-                self.query_one("#file_tree", DirectoryTree).reload()  # Reload the tree
+                self._file_tree.reload_path(parent_path)  # Reload the parent directory only
             except OSError as e:
-                status_message.update(f"[red]Error deleting[/red] {e.filename}:\n[red]{e.strerror}[/red]")
+                self._status_message.update(f"[red]Error deleting[/red] {e.filename}:\n[red]{e.strerror}[/red]")
                 self.log(f"Error deleting {self.selected_path}: {e}")
             except Exception as e:
-                status_message.update(f"[red]An unexpected error occurred:[/red] {e}")
+                self._status_message.update(f"[red]An unexpected error occurred:[/red] {e}")
                 self.log(f"Unexpected error deleting {self.selected_path}: {e}")
         else:
-            status_message.update("[yellow]Deletion cancelled.[/yellow]")
+            self._status_message.update("[yellow]Deletion cancelled.[/yellow]")
+
+    def _read_file(self, path: Path) -> str:
+        """Returns the file content, re-reading it only if it was modified since it was cached."""
+        stat = path.stat()
+        mtime = stat.st_mtime_ns
+        cached = self._file_cache.get(path)
+        if cached and cached[0] == mtime:
+            self._file_cache.move_to_end(path)
+            return cached[1]
+
+        if stat.st_size > READ_CHUNK_SIZE:
+            content = self._read_file_chunked(path, stat.st_size)
+        else:
+            content = path.read_text()
+        self._file_cache[path] = (mtime, content)
+        self._file_cache.move_to_end(path)
+        while len(self._file_cache) > FILE_CACHE_SIZE:
+            self._file_cache.popitem(last=False)
+        return content
+
+    def _read_file_chunked(self, path: Path, size: int) -> str:
+        """Reads a big file in chunks, reporting the loading progress in the status message."""
+        chunks = []
+        read = 0
+        with path.open() as f:
+            while chunk := f.read(READ_CHUNK_SIZE):
+                chunks.append(chunk)
+                read += len(chunk)
+                if path == self.selected_path:
+                    self.app.call_from_thread(
+                        self._status_message.update,
+                        f"Loading: [yellow]{path}[/yellow] ({min(100, read * 100 // size)}%)")
+        return "".join(chunks)
+
+    def _load_editor_content(self, path: Path, content: str) -> None:
+        """Loads content into the editor, re-using the parsed document of the path when it is still valid."""
+        document = self._documents.get(path)
+        # Cached documents are edited in place, so they are only valid while matching the file content
+        if document is not None and document.text == content:
+            self._editor.load_document(document)
+            self._documents.move_to_end(path)
+        else:
+            self._editor.load_text(content)
+            self._documents[path] = self._editor.document
+            self._documents.move_to_end(path)
+            while len(self._documents) > FILE_CACHE_SIZE:
+                self._documents.popitem(last=False)
+        self._loaded_path = path
 
     def has_unsaved_changes(self) -> bool:
         """Check if the editor content has changed since it was loaded or saved."""
         if self.selected_path and self.selected_path.is_file() and self.original_content is not None:
-            editor = self.query_one("#text_editor", YAMLTextArea)
-            return editor.text != self.original_content
+            return self._editor.text != self.original_content
         return False
 
     async def _handle_unsaved_changes(self) -> bool:
@@ -241,11 +319,10 @@ class FileBrowserEditorScreen(WizardConfigScreen):
         if not self.has_unsaved_changes():
             return True
 
-        tree = self.query_one("#file_tree", DirectoryTree)
         path_before_selection = self.selected_path
 
         message = "You have unsaved changes.\nDiscard changes and continue?"
-        proceed = await self.app.push_screen_wait(ConfirmExitScreen(message=message))
+        proceed = await self.app.push_screen_wait(self._confirm_exit_modal(message))
 
         if not proceed:
             # User cancelled. Revert the logical path and restore the visual cursor.
@@ -253,7 +330,7 @@ class FileBrowserEditorScreen(WizardConfigScreen):
             node_to_restore = self._find_node_by_path(path_before_selection)
             if node_to_restore:
                 self._ignore_selection_change = True
-                tree.select_node(node_to_restore)
+                self._file_tree.select_node(node_to_restore)
             return False
         return True
 
@@ -262,8 +339,6 @@ class FileBrowserEditorScreen(WizardConfigScreen):
         if not target_path:
             return None
 
-        tree = self.query_one("#file_tree", DirectoryTree)
-
         def search(node: TreeNode) -> TreeNode | None:
             if node.data and node.data.path == target_path:
                 return node
@@ -273,7 +348,7 @@ class FileBrowserEditorScreen(WizardConfigScreen):
                     return found
             return None
 
-        return search(tree.root)
+        return search(self._file_tree.root)
 
 
 class CreateNewEntryScreen(ModalScreen):
@@ -285,7 +360,7 @@ class CreateNewEntryScreen(ModalScreen):
 
     def __init__(self, base_path: Path, name: str | None = None, id: str | None = None, classes: str | None = None):
         super().__init__(name=name, id=id, classes=classes)
-        self.base_path = base_path
+        self.base_path = Path(base_path)
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the new entry screen."""
@@ -322,21 +397,20 @@ class CreateNewEntryScreen(ModalScreen):
             message_widget.update("[red]Error:[/red] Name cannot be empty.")
             return
 
-        new_path = Path(self.base_path).joinpath(entry_name)
-
-        if new_path.exists():
-            message_widget.update(f"[red]Error:[/red] '{entry_name}' already exists.")
-            return
+        new_path = self.base_path / entry_name
 
         try:
             if entry_type == "file":
-                new_path.touch()
+                # O_EXCL makes the existence check and the creation a single atomic call
+                os.close(os.open(new_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
                 message_widget.update(f"[green]File '{entry_name}' created successfully.[/green]")
             elif entry_type == "directory":
                 new_path.mkdir()
                 message_widget.update(f"[green]Directory '{entry_name}' created successfully.[/green]")
             self.log(f"our requested type is {entry_type}")
             self.dismiss((entry_name, entry_type))  # Dismiss with success result
+        except FileExistsError:
+            message_widget.update(f"[red]Error:[/red] '{entry_name}' already exists.")
         except Exception as e:
             message_widget.update(f"[red]Error creating entry:[/red] {e}")
             self.log(f"Error creating entry {new_path}: {e}")
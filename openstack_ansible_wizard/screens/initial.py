@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 import os
 from pathlib import Path
+import stat
+import time
 from shutil import copy as file_copy
 from subprocess import run as p_run
 from sys import executable as py_exec
 
+from rich.markup import escape
+from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, HorizontalGroup
@@ -25,13 +32,83 @@ from textual.widgets import Header, Footer, Button, Static
 from textual.reactive import reactive
 from textual.screen import Screen
 
-from openstack_ansible_wizard.screens.bootstrap import CloneOSAScreen
-from openstack_ansible_wizard.screens.editor import FileBrowserEditorScreen
-from openstack_ansible_wizard.screens.inventory import InventoryScreen
-from openstack_ansible_wizard.screens.networks import NetworkScreen
-from openstack_ansible_wizard.screens.service import ServicesMainScreen
+# Configuration screens are imported when first opened, to keep them and
+# their dependencies (like tree-sitter for the editor) out of the start up.
 from openstack_ansible_wizard.common.screens import ConfirmExitScreen, PathInputScreen
 
+# How long (in seconds) path probe results are re-used when returning to the screen
+PROBE_CACHE_TTL = 2.0
+# Bumped whenever the probed paths are known to have changed, invalidating cached probes
+_probe_generation = 0
+# Entries marking an OpenStack-Ansible checkout and an initialized configuration directory
+OSA_TOOLKIT_DIR = 'osa_toolkit'
+OSA_GENERATE_FILE = 'generate.py'
+USER_CONFIG_FILE = 'openstack_user_config.yml'
+# Marker path suffixes, concatenated to (posix) OpenStack-Ansible and configuration paths
+_OSA_SENTINEL = f'/{OSA_TOOLKIT_DIR}/{OSA_GENERATE_FILE}'
+_CONF_SENTINEL = f'/{USER_CONFIG_FILE}'
+
+
+@dataclass(frozen=True, slots=True)
+class PathsConfig:
+    """The probed setup paths, along with the full paths of their marker files."""
+
+    osa_dir: str
+    conf_dir: str
+    osa_sentinel: str
+    conf_sentinel: str
+
+    @classmethod
+    def from_dirs(cls, osa_dir: str, conf_dir: str) -> "PathsConfig":
+        """Builds the config for the directories, precomputing their marker file paths."""
+        return cls(osa_dir, conf_dir, osa_dir + _OSA_SENTINEL, conf_dir + _CONF_SENTINEL)
+
+
+def _probe_dir(directory: str, sentinel: str) -> tuple[bool, bool]:
+    """Returns whether the directory exists and whether it contains the sentinel file."""
+    # The common case is an existing setup, where a single stat of the sentinel answers both
+    try:
+        if stat.S_ISREG(os.stat(sentinel).st_mode):
+            return True, True
+    except OSError:
+        pass
+    return os.path.isdir(directory), False
+
+
+def _probe_paths(paths: PathsConfig) -> tuple[bool, bool, bool, bool]:
+    """Checks the OpenStack-Ansible and configuration paths on the filesystem
+
+    Returns whether the OpenStack-Ansible directory exists, whether it contains
+    osa_toolkit/generate.py, whether the configuration directory exists and
+    whether it contains openstack_user_config.yml.
+    """
+    osa_exists, osa_has_generate = _probe_dir(paths.osa_dir, paths.osa_sentinel)
+    conf_exists, conf_has_user_config = _probe_dir(paths.conf_dir, paths.conf_sentinel)
+    return osa_exists, osa_has_generate, conf_exists, conf_has_user_config
+
+
+@lru_cache(maxsize=64)
+def _cached_probe_paths(paths: PathsConfig, generation: tuple[int, int]) -> tuple[bool, bool, bool, bool]:
+    """Returns _probe_paths results, re-used for as long as the probe generation is the same."""
+    return _probe_paths(paths)
+
+
+@lru_cache(maxsize=64)
+def _status_markup(template: str, path: str) -> str:
+    """Returns the status template rendered for the path, with the path's markup escaped."""
+    return template.format(escape(path))
+
+
+def _current_probe_generation() -> tuple[int, int]:
+    """Returns the probe generation: explicit invalidations plus the current TTL time bucket."""
+    return _probe_generation, int(time.monotonic() // PROBE_CACHE_TTL)
+
+
+def invalidate_path_probes() -> None:
+    """Invalidates the cached path probe results, so the next probe hits the filesystem."""
+    global _probe_generation
+    _probe_generation += 1
+
 
 class InitialCheckScreen(Screen):
     """The initial screen that checks for OpenStack-Ansible presence."""
@@ -43,8 +120,28 @@ class InitialCheckScreen(Screen):
     osa_clone_dir = reactive(os.environ.get('OSA_CLONE_DIR', '/opt/openstack-ansible'))
     osa_conf_dir = os.environ.get('OSA_CONFIG_DIR', '/etc/openstack_deploy')
 
+    # Path status message templates
+    _TMPL_OK = "[green]✓[/green] {} exists."
+    _TMPL_MISSING = "[red]✗[/red] {} does not exist."
+    _TMPL_NO_PROPER = "[red]✗[/red] {} exists, but not proper OpenStack-Ansible folder."
+    _TMPL_NOT_INITIALIZED = "[red]✗[/red] {} exists but is not yet initialized."
+    _TMPL_NO_CONFIG = "No {} found. Proceed to configuration."
+    _TXT_NO_OSA = "Please provide the OpenStack-Ansible repository path."
+    _TXT_EMPTY = ""
+
+    def __init__(self, name: str | None = None, id: str | None = None, classes: str | None = None):
+        super().__init__(name=name, id=id, classes=classes)
+        self._button_state: dict[tuple[Button, str], bool] = {}
+        self._shown_status: dict[Static, str] = {}
+        self._warm_probe: tuple[PathsConfig, asyncio.Task] | None = None
+        self._paths: PathsConfig | None = None
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the initial check screen."""
+        # Start probing the paths already, so the result is ready by the time the screen is mounted
+        paths = self._paths_config()
+        self._warm_probe = (paths, asyncio.create_task(
+            asyncio.to_thread(_cached_probe_paths, paths, _current_probe_generation())))
         yield Header()
         with Container(classes="screen-container"):
             yield Static("OpenStack-Ansible Wizard", classes="title")
@@ -66,112 +163,152 @@ class InitialCheckScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when the screen is mounted."""
-        self.check_paths()
+        self._osa_status = self.query_one("#osa_path_status", Static)
+        self._etc_status = self.query_one("#etc_path_status", Static)
+        self._status_message = self.query_one("#status_message", Static)
+        self._clone_button = self.query_one("#clone_osa", Button)
+        self._custom_osa_path_button = self.query_one("#custom_osa_path", Button)
+        self._inventory_button = self.query_one("#inventory_config", Button)
+        self._network_button = self.query_one("#network_config", Button)
+        self._service_button = self.query_one("#service_config", Button)
+        self._init_config_button = self.query_one("#init_config_dir", Button)
+        self._custom_config_button = self.query_one("#custom_config_path", Button)
+        self._open_editor_button = self.query_one("#open_editor", Button)
+        # Buttons are composed disabled, so seed the applied state to skip re-writing it on the first check
+        for button in self.query(Button):
+            self._button_state[(button, "disabled")] = button.disabled
+            self._button_state[(button, "display")] = button.display
 
     def on_screen_resume(self) -> None:
-        """Called when this screen becomes the active screen again."""
+        """Called when this screen becomes the active screen, including when it is first pushed."""
+        # The only place paths are checked on (re-)entering the screen, so returning from another
+        # screen can not queue a second, re-entrant check
         self.check_paths()
 
-    def check_paths(self) -> None:
+    def _paths_config(self) -> PathsConfig:
+        """Returns the paths to probe, rebuilding them only when a directory was changed."""
+        paths = self._paths
+        if paths is None or paths.osa_dir != self.osa_clone_dir or paths.conf_dir != self.osa_conf_dir:
+            paths = self._paths = PathsConfig.from_dirs(self.osa_clone_dir, self.osa_conf_dir)
+        return paths
+
+    def invalidate_path_checks(self) -> None:
+        """Forgets the cached path probe results, so the next check hits the filesystem."""
+        invalidate_path_probes()
+
+    @work(exclusive=True, group="check-paths")
+    async def check_paths(self) -> None:
         """Performs the path checks and updates the UI."""
-        osa_path = Path(self.osa_clone_dir)
-        etc_path = Path(self.osa_conf_dir)
-
-        osa_status_widget = self.query_one("#osa_path_status", Static)
-        etc_status_widget = self.query_one("#etc_path_status", Static)
-        status_message_widget = self.query_one("#status_message", Static)
-
-        clone_button = self.query_one("#clone_osa", Button)
-        custom_osa_path_button = self.query_one("#custom_osa_path", Button)
-        proceed_config_button = self.query_one("#inventory_config", Button)
-        proceed_network_button = self.query_one("#network_config", Button)
-        proceed_service_button = self.query_one("#service_config", Button)
-        init_config_button = self.query_one("#init_config_dir", Button)
-        custom_config_button = self.query_one("#custom_config_path", Button)
-        open_editor_button = self.query_one("#open_editor", Button)
-
-        # init_config_button.display = False
-        check_osa_success = False
-        check_config_success = False
-
-        if osa_path.is_dir():
-            if Path(f'{self.osa_clone_dir}/osa_toolkit/generate.py').is_file():
-                osa_status_widget.update(f"[green]✓[/green] {self.osa_clone_dir} exists.")
-                clone_button.disabled = False
-                custom_osa_path_button.disabled = False
-                check_osa_success = True
-            else:
-                osa_status_widget.update(f"[red]✗[/red] {self.osa_clone_dir} exists, but not "
-                                         "proper OpenStack-Ansible folder.")
-                clone_button.disabled = False
-                custom_osa_path_button.disabled = False
+        paths = self._paths_config()
+        if self._warm_probe is not None and self._warm_probe[0] == paths:
+            # Shielded, as a cancelled (superseded) check must not cancel the shared probe
+            probe_result = await asyncio.shield(self._warm_probe[1])
         else:
-            osa_status_widget.update(f"[red]✗[/red] {self.osa_clone_dir} does not exist.")
-            status_message_widget.update("Please provide the OpenStack-Ansible repository path.")
-            clone_button.disabled = False
-            custom_osa_path_button.disabled = False
-
-        if etc_path.is_dir():
-            if Path(f'{self.osa_conf_dir}/openstack_user_config.yml').is_file():
-                etc_status_widget.update(f"[green]✓[/green] {self.osa_conf_dir} exists.")
-                status_message_widget.update("")
-                status_message_widget.display = False
-                proceed_config_button.disabled = True
-                proceed_network_button.disabled = True
-                proceed_service_button.disabled = True
-                init_config_button.display = False
-                open_editor_button.disabled = False
-                check_config_success = True
+            # Filesystem checks may block on slow or network storage, so keep them off the event loop
+            probe_result = await asyncio.to_thread(_cached_probe_paths, paths, _current_probe_generation())
+        self._warm_probe = None
+        osa_exists, osa_has_generate, conf_exists, conf_has_user_config = probe_result
+
+        # Apply all widget changes in a single screen update
+        with self.app.batch_update():
+            disabled: dict[Button, bool] = {}
+            shown: dict[Button, bool] = {}
+            # self._init_config_button.display = False
+            if osa_exists:
+                if osa_has_generate:
+                    self._set_status(self._osa_status, _status_markup(self._TMPL_OK, self.osa_clone_dir))
+                    disabled[self._clone_button] = False
+                    disabled[self._custom_osa_path_button] = False
+                else:
+                    self._set_status(self._osa_status, _status_markup(self._TMPL_NO_PROPER, self.osa_clone_dir))
+                    disabled[self._clone_button] = False
+                    disabled[self._custom_osa_path_button] = False
             else:
-                etc_status_widget.update(f"[red]✗[/red] {self.osa_conf_dir} exists but is not yet initialized.")
-                proceed_config_button.disabled = True
-                proceed_config_button.display = False
-                proceed_network_button.disabled = True
-                proceed_network_button.display = False
-                proceed_service_button.disabled = True
-                proceed_service_button.display = False
-                open_editor_button.disabled = False
-                custom_config_button.disabled = False
-                init_config_button.disabled = False
-                init_config_button.display = True
-        else:
-            etc_status_widget.update(f"[red]✗[/red] {self.osa_conf_dir} does not exist.")
-            if osa_path.is_dir():  # Only suggest config if OSA repo is found
-                status_message_widget.update(f"No {self.osa_conf_dir} found. Proceed to configuration.")
-                custom_config_button.disabled = False
-                init_config_button.disabled = False
-                init_config_button.display = True
-            proceed_config_button.disabled = True
-            proceed_config_button.display = False
-            proceed_network_button.disabled = True
-            proceed_network_button.display = False
-            proceed_service_button.disabled = True
-            proceed_service_button.display = False
-            open_editor_button.disabled = True
-            open_editor_button.display = False
-
-        if check_osa_success and check_config_success:
-            # Automatically switch to editor if all required settings exist
-            # self.call_after_refresh(lambda: self.app.push_screen(FileBrowserEditorScreen(initial_path=str(etc_path))))
-            open_editor_button.disabled = False
-            proceed_config_button.disabled = False
-            proceed_config_button.display = True
-            proceed_network_button.disabled = False
-            proceed_network_button.display = True
-            proceed_service_button.disabled = False
-            proceed_service_button.display = True
-            custom_config_button.disabled = False
-            open_editor_button.display = True
-            init_config_button.display = False
+                self._set_status(self._osa_status, _status_markup(self._TMPL_MISSING, self.osa_clone_dir))
+                self._set_status(self._status_message, self._TXT_NO_OSA)
+                disabled[self._clone_button] = False
+                disabled[self._custom_osa_path_button] = False
+
+            if conf_exists:
+                if conf_has_user_config:
+                    self._set_status(self._etc_status, _status_markup(self._TMPL_OK, self.osa_conf_dir))
+                    self._set_status(self._status_message, self._TXT_EMPTY)
+                    self._status_message.display = False
+                    disabled[self._inventory_button] = True
+                    disabled[self._network_button] = True
+                    disabled[self._service_button] = True
+                    shown[self._init_config_button] = False
+                    disabled[self._open_editor_button] = False
+                else:
+                    self._set_status(self._etc_status, _status_markup(self._TMPL_NOT_INITIALIZED, self.osa_conf_dir))
+                    disabled[self._inventory_button] = True
+                    shown[self._inventory_button] = False
+                    disabled[self._network_button] = True
+                    shown[self._network_button] = False
+                    disabled[self._service_button] = True
+                    shown[self._service_button] = False
+                    disabled[self._open_editor_button] = False
+                    disabled[self._custom_config_button] = False
+                    disabled[self._init_config_button] = False
+                    shown[self._init_config_button] = True
+            else:
+                self._set_status(self._etc_status, _status_markup(self._TMPL_MISSING, self.osa_conf_dir))
+                if osa_exists:  # Only suggest config if OSA repo is found
+                    self._set_status(self._status_message, _status_markup(self._TMPL_NO_CONFIG, self.osa_conf_dir))
+                    disabled[self._custom_config_button] = False
+                    disabled[self._init_config_button] = False
+                    shown[self._init_config_button] = True
+                disabled[self._inventory_button] = True
+                shown[self._inventory_button] = False
+                disabled[self._network_button] = True
+                shown[self._network_button] = False
+                disabled[self._service_button] = True
+                shown[self._service_button] = False
+                disabled[self._open_editor_button] = True
+                shown[self._open_editor_button] = False
+
+            # Marker files are only probed inside existing directories, so they imply both checks passed
+            if osa_has_generate and conf_has_user_config:
+                # Automatically switch to editor if all required settings exist
+                # self.call_after_refresh(
+                #     lambda: self.app.push_screen(FileBrowserEditorScreen(initial_path=self.osa_conf_dir)))
+                disabled[self._open_editor_button] = False
+                disabled[self._inventory_button] = False
+                shown[self._inventory_button] = True
+                disabled[self._network_button] = False
+                shown[self._network_button] = True
+                disabled[self._service_button] = False
+                shown[self._service_button] = True
+                disabled[self._custom_config_button] = False
+                shown[self._open_editor_button] = True
+                shown[self._init_config_button] = False
+            self._apply_button_states(disabled, shown)
+
+    def _set_status(self, widget: Static, markup: str) -> None:
+        """Updates a status widget, skipping the update when it already shows the markup."""
+        # Each update parses into a new Text, so widgets never share a mutable renderable
+        if self._shown_status.get(widget) != markup:
+            widget.update(Text.from_markup(markup))
+            self._shown_status[widget] = markup
+
+    def _apply_button_states(self, disabled: dict[Button, bool], shown: dict[Button, bool]) -> None:
+        """Applies button disabled/display states, only writing the ones that changed since last applied."""
+        for attribute, states in (("disabled", disabled), ("display", shown)):
+            for button, value in states.items():
+                if self._button_state.get((button, attribute)) != value:
+                    setattr(button, attribute, value)
+                    self._button_state[(button, attribute)] = value
 
     @on(Button.Pressed, "#clone_osa")
     @work
     async def clone_repo(self) -> None:
         """Simulates cloning the OpenStack-Ansible repository."""
+        from openstack_ansible_wizard.screens.bootstrap import CloneOSAScreen
         osa_cloned = await self.app.push_screen_wait(CloneOSAScreen(clone_path=self.osa_clone_dir))
         if osa_cloned:
             # Update the reactive path is likely not needed as we're passing reactive object to the screen
-            self.osa_clone_dir = osa_cloned
+            self.set_reactive(InitialCheckScreen.osa_clone_dir, osa_cloned)
+            self.invalidate_path_checks()
             self.check_paths()  # Re-check paths with the new custom path
 
     @on(Button.Pressed, "#custom_osa_path")
@@ -179,8 +316,11 @@ class InitialCheckScreen(Screen):
     async def enter_custom_osa_path(self) -> None:
         """Pushes the screen to enter a custom path and awaits the result."""
         custom_osa_path_resp = await self.app.push_screen_wait(PathInputScreen(path_type="openstack-ansible"))
-        if custom_osa_path_resp:
-            self.osa_clone_dir = custom_osa_path_resp  # Update the reactive path
+        # Re-entering the current path changes nothing, so it needs no re-check either
+        if custom_osa_path_resp and custom_osa_path_resp != self.osa_clone_dir:
+            # Paths are re-checked explicitly below, so there is no need for a refresh in between
+            self.set_reactive(InitialCheckScreen.osa_clone_dir, custom_osa_path_resp)
+            self.invalidate_path_checks()
             self.check_paths()  # Re-check paths with the new custom path
 
     @on(Button.Pressed, "#custom_config_path")
@@ -188,28 +328,33 @@ class InitialCheckScreen(Screen):
     async def enter_custom_config_path(self) -> None:
         """Pushes the screen to enter a custom path and awaits the result."""
         custom_osa_config_resp = await self.app.push_screen_wait(PathInputScreen(path_type="openstack_deploy"))
-        if custom_osa_config_resp:
+        if custom_osa_config_resp and custom_osa_config_resp != self.osa_conf_dir:
             self.osa_conf_dir = custom_osa_config_resp  # Update the reactive path
+            self.invalidate_path_checks()
             self.check_paths()  # Re-check paths with the new custom path
 
     @on(Button.Pressed, "#inventory_config")
     def configure_inventory(self) -> None:
         """Pushes the inventory configuration screen."""
+        from openstack_ansible_wizard.screens.inventory import InventoryScreen
         self.app.push_screen(InventoryScreen(config_path=self.osa_conf_dir, osa_path=self.osa_clone_dir))
 
     @on(Button.Pressed, "#network_config")
     def configure_networks(self) -> None:
         """Pushes the network configuration screen."""
+        from openstack_ansible_wizard.screens.networks import NetworkScreen
         self.app.push_screen(NetworkScreen(config_path=self.osa_conf_dir, osa_path=self.osa_clone_dir))
 
     @on(Button.Pressed, "#service_config")
     def configure_services(self) -> None:
         """Pushes the main service configuration screen."""
+        from openstack_ansible_wizard.screens.service import ServicesMainScreen
         self.app.push_screen(ServicesMainScreen(config_path=self.osa_conf_dir, osa_path=self.osa_clone_dir))
 
     @on(Button.Pressed, "#open_editor")
     def open_editor(self) -> None:
         """Pushes the file browser/editor screen for openstack_deploy."""
+        from openstack_ansible_wizard.screens.editor import FileBrowserEditorScreen
         self.app.push_screen(FileBrowserEditorScreen(initial_path=self.osa_conf_dir))
 
     @on(Button.Pressed, "#init_config_dir")
@@ -231,7 +376,7 @@ class InitialCheckScreen(Screen):
             for dir in init_directories:
                 dir.mkdir(exist_ok=True)
 
-            (conf_dir_path / "openstack_user_config.yml").touch(exist_ok=True)
+            (conf_dir_path / USER_CONFIG_FILE).touch(exist_ok=True)
 
             # Copy user_secrets.yml from the OSA repository
             source_secrets_file = Path(self.osa_clone_dir) / "etc" / "openstack_deploy" / "user_secrets.yml"
@@ -240,8 +385,9 @@ class InitialCheckScreen(Screen):
                 file_copy(source_secrets_file, dest_secrets_file)
                 p_run([
                     py_exec,
-                    f"{self.osa_clone_dir}/scripts/pw-token-gen.py",
+                    os.path.join(self.osa_clone_dir, "scripts", "pw-token-gen.py"),
                     "--file",
                     str(dest_secrets_file)
                 ])
+            self.invalidate_path_checks()
             self.check_paths()
@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
+from bisect import bisect_right
 import ipaddress
 from pathlib import Path
-import time
+import socket
 import yaml
 
 from textual.app import ComposeResult
@@ -26,8 +26,117 @@ from textual.screen import ModalScreen
 from ruamel.yaml import YAML, YAMLError
 from ruamel.yaml.comments import CommentedMap
 from textual import on, work
-
-from openstack_ansible_wizard.common.screens import ConfirmExitScreen, WizardConfigScreen
+from textual.worker import get_current_worker
+
+from openstack_ansible_wizard.common.screens import WizardConfigScreen
+from openstack_ansible_wizard.extensions.data_table import DoubleClickDataTable
+
+# libyaml-backed safe loader when PyYAML was built with it, which parses several times faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Select options for the provider network type, shared by every provider network modal
+_TYPE_OPTIONS = tuple((t, t) for t in ('raw', 'vxlan', 'geneve', 'flat', 'vlan'))
+# Names under which the network screen installs its reused modals
+_PN_MODAL_NAME = "network-provider-network-modal"
+_CIDR_MODAL_NAME = "network-cidr-modal"
+
+
+def _pn_row(item: dict) -> tuple[str, ...]:
+    """Build the provider networks table cells for one provider network."""
+    net = item.get("network", {})
+    return (
+        "✓" if net.get("is_management_address") else "",
+        net.get("container_bridge", "N/A"),
+        net.get("type", "N/A"),
+        net.get("container_interface", "N/A"),
+        net.get("ip_from_q", "N/A"),
+        ", ".join(net.get("group_binds", [])),
+    )
+
+
+def _cidr_row(name: str, data: dict) -> tuple[str, ...]:
+    """Build the CIDR networks table cells for one CIDR network."""
+    return name, data.get("cidr", "N/A"), ", ".join(data.get("used_ips", []))
+
+
+def _with_static_routes(p_net: dict, routes: list[dict]) -> dict:
+    """Return a copy of a provider network with its static routes replaced."""
+    # Only the mappings on the path to the routes are copied; the originals are shared with initial_data
+    return {**p_net, "network": {**p_net.get("network", {}), "static_routes": routes}}
+
+
+def _round_trip_yaml() -> YAML:
+    """Create the comment-preserving YAML parser used to write openstack_user_config.yml."""
+    yaml_parser = YAML()
+    yaml_parser.indent(mapping=2, sequence=4, offset=2)
+    yaml_parser.preserve_quotes = True
+    yaml_parser.explicit_start = True
+    return yaml_parser
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    """Return the modification time and size of a file, to tell whether it changed."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _collect_static_routes(provider_networks: list) -> list[dict]:
+    """Flatten the static routes of all provider networks, tagged with their bridge."""
+    processed_routes = []
+    for p_net in provider_networks:
+        net_info = p_net.get("network", {})
+        bridge = net_info.get("container_bridge")
+        if bridge and "static_routes" in net_info:
+            for route in net_info["static_routes"]:
+                processed_routes.append({
+                    "network_bridge": bridge,
+                    **route
+                })
+    return processed_routes
+
+
+def _ip_to_int(address: str) -> tuple[int, int]:
+    """Return the IP version and integer value of an address, raising ValueError if invalid."""
+    try:
+        # inet_pton is a much cheaper strict parser for the common IPv4 case
+        return 4, int.from_bytes(socket.inet_pton(socket.AF_INET, address), "big")
+    except OSError:
+        ip = ipaddress.ip_address(address)
+        return ip.version, int(ip)
+
+
+class _CidrIndex:
+    """Finds which CIDR network contains an IP address, using a binary search over network ranges."""
+
+    def __init__(self, networks: list[tuple[str, ipaddress.IPv4Network | ipaddress.IPv6Network]]) -> None:
+        # Networks in config order, as integer ranges, for the (rare) overlapping CIDRs case
+        self._ranges = [
+            (name, network.version, int(network.network_address), int(network.broadcast_address))
+            for name, network in networks
+        ]
+        self._starts: dict[int, list[int]] = {}
+        self._sorted: dict[int, list[tuple[int, int, str]]] = {}
+        self._overlapping = False
+        for version in (4, 6):
+            ranges = sorted((start, end, name) for name, ver, start, end in self._ranges if ver == version)
+            self._sorted[version] = ranges
+            self._starts[version] = [start for start, _, _ in ranges]
+            if any(ranges[i][0] <= ranges[i - 1][1] for i in range(1, len(ranges))):
+                self._overlapping = True
+
+    def find(self, ip_version: int, ip_int: int) -> str | None:
+        """Returns the name of the network containing the IP, given as version and integer, or None."""
+        if self._overlapping:
+            # With nested networks the first one in the config wins, like a plain scan
+            for name, version, start, end in self._ranges:
+                if version == ip_version and start <= ip_int <= end:
+                    return name
+            return None
+        idx = bisect_right(self._starts[ip_version], ip_int) - 1
+        if idx >= 0:
+            start, end, name = self._sorted[ip_version][idx]
+            if ip_int <= end:
+                return name
+        return None
 
 
 class AddEditStaticRouteScreen(ModalScreen):
@@ -43,6 +152,7 @@ class AddEditStaticRouteScreen(ModalScreen):
             name: str | None = None, id: str | None = None, classes: str | None = None):
         super().__init__(name, id, classes)
         self.provider_network_options = provider_network_options
+        self._network_select_options = [(name, name) for name in provider_network_options]
         self.route_data = route_data or {}
 
     def compose(self) -> ComposeResult:
@@ -55,7 +165,7 @@ class AddEditStaticRouteScreen(ModalScreen):
             yield Static(id="static_route_error", classes="status-message modal-status-message-2")
             yield Label("Provider Network:")
             yield Select(
-                options=[(name, name) for name in self.provider_network_options],
+                options=self._network_select_options,
                 value=self.route_data.get("network_bridge", Select.BLANK),
                 id="route_network_bridge",
                 allow_blank=False,
@@ -122,14 +232,47 @@ class AddEditProviderNetworkScreen(ModalScreen):
             name: str | None = None, id: str | None = None, classes: str | None = None):
         super().__init__(name, id, classes)
         self.cidr_options = cidr_options
+        self._cidr_select_options = [(name, name) for name in cidr_options]
+        self._cidr_options_set = set(cidr_options)
         self.existing_interfaces = existing_interfaces
         self.network_data = network_data or {}
         self.is_management_network_set = is_management_network_set
 
-    def compose(self) -> ComposeResult:
+    def reset(
+            self, cidr_options: list[str], existing_interfaces: list[str], is_management_network_set: bool,
+            network_data: dict | None = None) -> None:
+        """Re-target the modal to another network, updating its widgets if already composed."""
+        self.cidr_options = cidr_options
+        self._cidr_select_options = [(name, name) for name in cidr_options]
+        self._cidr_options_set = set(cidr_options)
+        self.existing_interfaces = existing_interfaces
+        self.network_data = network_data or {}
+        self.is_management_network_set = is_management_network_set
+        if not self.is_mounted:
+            return
+
+        form = self._form_state()
+        net = form["net"]
+        self.query_one("#provider_network_title", Static).update(form["title"])
+        self.query_one("#provider_network_error", Static).update("")
+        self.query_one("#net_bridge", Input).value = net.get("container_bridge", "")
+        self.query_one("#net_type", Select).value = net.get("type", Select.BLANK)
+        self.query_one("#net_interface", Input).value = net.get("container_interface", "")
+        self.query_one("#host_interface", Input).value = net.get("host_bind_override", "")
+        ip_from_q_select = self.query_one("#net_ip_from_q", Select)
+        ip_from_q_select.set_options(self._cidr_select_options)
+        ip_from_q_select.value = form["ip_from_q"]
+        self.query_one("#net_groups", TextArea).text = "\n".join(net.get("group_binds", []))
+        checkbox = self.query_one("#is_management_checkbox", Checkbox)
+        checkbox.value = form["is_management"]
+        checkbox.disabled = form["management_disabled"]
+        checkbox.tooltip = form["management_tooltip"]
+        self.query_one("#add_provider_network", Button).label = form["button_label"]
+        self.set_focus(self.query_one("#net_bridge", Input))
+
+    def _form_state(self) -> dict:
+        """Derive the initial widget values for the network being added or edited."""
         is_editing = bool(self.network_data)
-        title = "Edit Provider Network" if is_editing else "Add Provider Network"
-        button_label = "Update Network" if is_editing else "Add Network"
         net = self.network_data.get('network', {})
 
         is_current_management = net.get("is_management_address", False)
@@ -141,17 +284,37 @@ class AddEditProviderNetworkScreen(ModalScreen):
         # Validate that the network's currently assigned CIDR still exists.
         # If not, reset it to blank to prevent a crash when rendering the Select widget.
         current_ip_from_q = net.get("ip_from_q", Select.BLANK)
-        if current_ip_from_q not in self.cidr_options:
+        if current_ip_from_q not in self._cidr_options_set:
             current_ip_from_q = Select.BLANK
 
+        return {
+            "net": net,
+            "title": "Edit Provider Network" if is_editing else "Add Provider Network",
+            "button_label": "Update Network" if is_editing else "Add Network",
+            "is_management": is_current_management,
+            "management_disabled": management_checkbox_disabled,
+            "management_tooltip": management_checkbox_tooltip,
+            "ip_from_q": current_ip_from_q,
+        }
+
+    def compose(self) -> ComposeResult:
+        form = self._form_state()
+        net = form["net"]
+        title = form["title"]
+        button_label = form["button_label"]
+        is_current_management = form["is_management"]
+        management_checkbox_disabled = form["management_disabled"]
+        management_checkbox_tooltip = form["management_tooltip"]
+        current_ip_from_q = form["ip_from_q"]
+
         with Grid(id="provider_network_dialog", classes="modal-screen-grid"):
-            yield Static(title, classes="title")
+            yield Static(title, id="provider_network_title", classes="title")
             yield Static(id="provider_network_error", classes="status-message modal-status-message-2")
             yield Label("Bridge:")
             yield Input(value=net.get("container_bridge", ""), id="net_bridge", placeholder="br-mgmt")
             yield Label("Type:")
             yield Select(
-                options=[(t, t) for t in ['raw', 'vxlan', 'geneve', 'flat', 'vlan']],
+                options=_TYPE_OPTIONS,
                 value=net.get("type", Select.BLANK),
                 id="net_type",
             )
@@ -161,7 +324,7 @@ class AddEditProviderNetworkScreen(ModalScreen):
             yield Input(value=net.get("host_bind_override", ""), id="host_interface", placeholder="bond1")
             yield Label("IP From Network:")
             yield Select(
-                options=[(name, name) for name in self.cidr_options],
+                options=self._cidr_select_options,
                 value=current_ip_from_q,
                 id="net_ip_from_q",
                 allow_blank=True
@@ -208,10 +371,9 @@ class AddEditProviderNetworkScreen(ModalScreen):
             error_widget.update(f"[red]Container Interface '{interface}' is already in use.[/red]")
             return
 
-        # Start with a copy of the original data to preserve un-edited fields.
-        result = copy.deepcopy(self.network_data)
-        if "network" not in result:
-            result["network"] = {}
+        # Start with a copy of the original data to preserve un-edited fields. Only the
+        # "network" mapping gets modified below, so a two-level shallow copy is enough.
+        result = {**self.network_data, "network": {**self.network_data.get("network", {})}}
 
         groups_text = self.query_one("#net_groups", TextArea).text
         groups = [g.strip() for g in groups_text.splitlines() if g.strip()]
@@ -253,21 +415,34 @@ class AddEditCidrNetworkScreen(ModalScreen):
         super().__init__(name, id, classes)
         self.cidr_data = cidr_data
 
-    def compose(self) -> ComposeResult:
-        is_editing = self.cidr_data is not None
-        if is_editing:
+    def reset(self, cidr_data: tuple[str, dict] | None = None) -> None:
+        """Re-target the modal to another CIDR network, updating its widgets if already composed."""
+        self.cidr_data = cidr_data
+        if not self.is_mounted:
+            return
+
+        title, button_label, cidr_name, cidr_value, used_ips_text = self._form_state()
+        self.query_one("#cidr_title", Static).update(title)
+        self.query_one("#cidr_error_message", Static).update("")
+        self.query_one("#cidr_name", Input).value = cidr_name
+        self.query_one("#cidr_value", Input).value = cidr_value
+        self.query_one("#cidr_used_ips", TextArea).text = used_ips_text
+        self.query_one("#add_cidr_button", Button).label = button_label
+        self.set_focus(self.query_one("#cidr_name", Input))
+
+    def _form_state(self) -> tuple[str, str, str, str, str]:
+        """Derive the title, button label and initial field values for the CIDR being edited."""
+        if self.cidr_data is not None:
             cidr_name, data = self.cidr_data
-            cidr_value = data.get("cidr", "")
             used_ips_text = "\n".join(data.get("used_ips", []))
-            button_label = "Update CIDR"
-        else:
-            cidr_name, cidr_value, used_ips_text = "", "", ""
-            button_label = "Add CIDR"
+            return "Edit CIDR Network", "Update CIDR", cidr_name, data.get("cidr", ""), used_ips_text
+        return "Add CIDR Network", "Add CIDR", "", "", ""
 
-        title = "Edit CIDR Network" if is_editing else "Add CIDR Network"
+    def compose(self) -> ComposeResult:
+        title, button_label, cidr_name, cidr_value, used_ips_text = self._form_state()
 
         with Grid(id="cidr_network_dialog", classes="modal-screen-grid"):
-            yield Static(title, classes="title")
+            yield Static(title, id="cidr_title", classes="title")
             yield Static(id="cidr_error_message", classes="status-message modal-status-message-2")
             yield Label("Network Name:")
             yield Input(value=cidr_name, placeholder="management",
@@ -308,24 +483,47 @@ class AddEditCidrNetworkScreen(ModalScreen):
             error_widget.update(f"[red]'{value}' is not a valid network CIDR.[/red]")
             return
 
-        # 2. Validate that all used IPs are valid and within the CIDR
+        # 2. Validate that all used IPs are valid and within the CIDR, which can take a
+        # while for long lists, so it runs in a worker thread
+        error_widget.update("[yellow]Validating...[/yellow]")
+        self.validate_used_ips(name, value, network, used_ips_list)
+
+    @work(thread=True, exclusive=True, group="validate-cidr")
+    def validate_used_ips(
+            self, name: str, value: str, network: ipaddress.IPv4Network | ipaddress.IPv6Network,
+            used_ips_list: list[str]) -> None:
+        """Check the used IP ranges against the network, then dismiss with the result or report the error."""
+        # Containment is checked on the integer bounds of the network, computed once
+        net_start, net_end = int(network.network_address), int(network.broadcast_address)
+
+        def in_network(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+            return ip.version == network.version and net_start <= int(ip) <= net_end
+
+        error = None
         try:
             for ip_range in used_ips_list:
                 parts = [p.strip() for p in ip_range.split(',')]
                 start_ip = ipaddress.ip_address(parts[0])
-                end_ip = ipaddress.ip_address(parts[-1])
-                if start_ip not in network or end_ip not in network:
-                    error_widget.update(f"[red]IP range '{ip_range}' is outside the '{value}' CIDR.[/red]")
-                    return
+                # A single IP is both the start and the end of its range
+                end_ip = ipaddress.ip_address(parts[-1]) if len(parts) > 1 else start_ip
+                if not in_network(start_ip) or not in_network(end_ip):
+                    error = f"[red]IP range '{ip_range}' is outside the '{value}' CIDR.[/red]"
+                    break
         except ValueError as e:
-            error_widget.update(f"[red]Invalid IP address in 'Used IPs': {e}[/red]")
+            error = f"[red]Invalid IP address in 'Used IPs': {e}[/red]"
+
+        # A newer save press supersedes this validation
+        if get_current_worker().is_cancelled:
+            return
+        if error:
+            self.app.call_from_thread(self.query_one("#cidr_error_message", Static).update, error)
             return
 
         result = {
             "cidr": value,
             "used_ips": used_ips_list
         }
-        self.dismiss((name, result))
+        self.app.call_from_thread(self.dismiss, (name, result))
 
     @on(Button.Pressed, "#cancel_button")
     def action_pop_screen(self) -> None:
@@ -347,18 +545,24 @@ class NetworkScreen(WizardConfigScreen):
         self.user_config_file = Path(self.config_path) / "openstack_user_config.yml"
         self.osa_path = osa_path
         self.initial_data = {}
-        # For handling double-clicks on the CIDR table
-        self._last_cidr_row_click_time = 0.0
-        self._last_clicked_cidr_row_key = None
+        # Set by every edit and cleared on save, so has_unsaved_changes needs no comparison
+        self._dirty = False
+        # Round-trip document of the config file, parsed by the first save and reused
+        # by later ones while the file is unchanged
+        self._rt_doc = None
+        self._rt_stamp: tuple[int, int] | None = None
+        # Sorted used_ips of initial_data, for _recompute_dirty
+        self._initial_used_ips: list[str] = []
+        # Provider network and CIDR modals, composed on first use and then reused
+        self._pn_modal: AddEditProviderNetworkScreen | None = None
+        self._cidr_modal: AddEditCidrNetworkScreen | None = None
+        # Rows currently selected in the CIDR, Provider Network and Static Route tables
         self.selected_cidr_key: str | None = None
-        # For handling double-clicks on the Provider Network table
-        self._last_pn_row_click_time = 0.0
-        self._last_clicked_pn_row_key = None
         self.selected_pn_key: str | None = None
-        # For handling double-clicks on the Static Route table
-        self._last_sr_row_click_time = 0.0
-        self._last_clicked_sr_row_key = None
         self.selected_sr_key: str | None = None
+        # Provider network row keys, in provider_networks order
+        self._pn_row_keys: list[str] = []
+        self._next_pn_key = 0
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the screen."""
@@ -368,21 +572,21 @@ class NetworkScreen(WizardConfigScreen):
             yield Static(id="status_message", classes="status-message")
 
             yield Static("Provider Networks", classes="subtitle")
-            yield DataTable(id="provider_networks_table", cursor_type="row", zebra_stripes=True)
+            yield DoubleClickDataTable(id="provider_networks_table", cursor_type="row", zebra_stripes=True)
             with HorizontalGroup(classes="button-row"):
                 yield Button("Add Network", id="add_provider_net_button", variant="primary")
                 yield Button("Edit Network", id="edit_provider_net_button", variant="default", disabled=True)
                 yield Button("Delete Network", id="delete_provider_net_button", variant="error", disabled=True)
 
             yield Static("CIDR Networks & Used IPs", classes="subtitle")
-            yield DataTable(id="cidr_networks_table", cursor_type="row", zebra_stripes=True)
+            yield DoubleClickDataTable(id="cidr_networks_table", cursor_type="row", zebra_stripes=True)
             with HorizontalGroup(classes="button-row"):
                 yield Button("Add CIDR", id="add_cidr_button", variant="primary")
                 yield Button("Edit CIDR", id="edit_cidr_button", variant="default", disabled=True)
                 yield Button("Delete CIDR", id="delete_cidr_button", variant="error", disabled=True)
 
             yield Static("Static Routes", classes="subtitle")
-            yield DataTable(id="static_routes_table", cursor_type="row", zebra_stripes=True)
+            yield DoubleClickDataTable(id="static_routes_table", cursor_type="row", zebra_stripes=True)
             with HorizontalGroup(classes="button-row"):
                 yield Button("Add Route", id="add_static_route_button", variant="primary")
                 yield Button("Edit Route", id="edit_static_route_button", variant="default", disabled=True)
@@ -394,21 +598,24 @@ class NetworkScreen(WizardConfigScreen):
 
     def on_mount(self) -> None:
         """Set up the tables and load initial data."""
-        self.query_one("#edit_provider_net_button", Button).display = False
-        self.query_one("#delete_provider_net_button", Button).display = False
-        self.query_one("#edit_cidr_button", Button).display = False
-        self.query_one("#delete_cidr_button", Button).display = False
-        self.query_one("#edit_static_route_button", Button).display = False
-        self.query_one("#delete_static_route_button", Button).display = False
-
-        pn_table = self.query_one("#provider_networks_table", DataTable)
-        pn_table.add_columns("Mgmt", "Bridge", "Type", "Interface", "IP From", "Groups")
-
-        cn_table = self.query_one("#cidr_networks_table", DataTable)
-        cn_table.add_columns("Name", "CIDR", "Used IP Ranges")
-
-        sr_table = self.query_one("#static_routes_table", DataTable)
-        sr_table.add_columns("Network", "CIDR", "Gateway")
+        # Cache the widgets that selection and edit handlers update on every event
+        self._status_message = self.query_one("#status_message", Static)
+        self._pn_table = self.query_one("#provider_networks_table", DataTable)
+        self._cn_table = self.query_one("#cidr_networks_table", DataTable)
+        self._sr_table = self.query_one("#static_routes_table", DataTable)
+        self._edit_pn_button = self.query_one("#edit_provider_net_button", Button)
+        self._delete_pn_button = self.query_one("#delete_provider_net_button", Button)
+        self._edit_cidr_button = self.query_one("#edit_cidr_button", Button)
+        self._delete_cidr_button = self.query_one("#delete_cidr_button", Button)
+        self._edit_sr_button = self.query_one("#edit_static_route_button", Button)
+        self._delete_sr_button = self.query_one("#delete_static_route_button", Button)
+        for button in (self._edit_pn_button, self._delete_pn_button, self._edit_cidr_button,
+                       self._delete_cidr_button, self._edit_sr_button, self._delete_sr_button):
+            button.display = False
+
+        self._pn_columns = self._pn_table.add_columns("Mgmt", "Bridge", "Type", "Interface", "IP From", "Groups")
+        self._cn_columns = self._cn_table.add_columns("Name", "CIDR", "Used IP Ranges")
+        self._sr_table.add_columns("Network", "CIDR", "Gateway")
 
         self.load_configs()
 
@@ -416,21 +623,22 @@ class NetworkScreen(WizardConfigScreen):
     def load_configs(self) -> None:
         """Parses openstack_user_config.yml to load and associate network data."""
         if not self.user_config_file.exists():
-            self.query_one("#status_message").update(f"[red]File not found: {self.user_config_file}[/red]")
+            self.app.call_from_thread(
+                self._status_message.update, f"[red]File not found: {self.user_config_file}[/red]")
             return
 
+        # Only plain data is needed to fill the tables; the comment-preserving
+        # round-trip document is parsed lazily by the first save.
         try:
             with self.user_config_file.open('r') as f:
-                data = yaml.safe_load(f)
-        except (YAMLError, IOError) as e:
-            self.query_one("#status_message").update(f"[red]Error loading YAML: {e}[/red]")
+                data = yaml.load(f, Loader=_SafeLoader)
+        except (yaml.YAMLError, IOError) as e:
+            self.app.call_from_thread(self._status_message.update, f"[red]Error loading YAML: {e}[/red]")
             return
 
         if data is None:
             data = {}
 
-        self.initial_data = copy.deepcopy(data)
-
         # Load raw data
         global_overrides = data.get("global_overrides", {})
         provider_networks_raw = global_overrides.get("provider_networks", [])
@@ -451,69 +659,68 @@ class NetworkScreen(WizardConfigScreen):
                 self.log(f"Warning: Invalid CIDR '{cidr_str}' for network '{name}' found in config.")
                 continue
 
+        find_network = _CidrIndex(cidr_net_objects).find
+        used_ips_by_network = {name: data["used_ips"] for name, data in processed_cidrs.items()}
+
         for ip_range_str in used_ips_raw:
             try:
                 # Use the first IP of a range to determine which network it belongs to
                 first_ip_str = ip_range_str.split(',')[0].strip()
-                ip = ipaddress.ip_address(first_ip_str)
-                found = False
-                for net_name, network in cidr_net_objects:
-                    if ip in network:
-                        processed_cidrs[net_name]["used_ips"].append(ip_range_str)
-                        found = True
-                        break
-                if not found:
+                net_name = find_network(*_ip_to_int(first_ip_str))
+                if net_name is not None:
+                    used_ips_by_network[net_name].append(ip_range_str)
+                else:
                     self.log(f"Warning: Used IP range '{ip_range_str}' does not belong to any defined CIDR network.")
             except ValueError:
                 self.log(f"Warning: Invalid IP address or range '{ip_range_str}' found in used_ips.")
 
-        # Process static routes
-        processed_routes = []
-        for i, p_net in enumerate(provider_networks_raw):
-            net_info = p_net.get("network", {})
-            bridge = net_info.get("container_bridge")
-            if bridge and "static_routes" in net_info:
-                for route in net_info["static_routes"]:
-                    processed_routes.append({
-                        "network_bridge": bridge,
-                        **route
-                    })
-
-        # Set reactive properties
-        self.provider_networks = provider_networks_raw
-        self.cidr_networks = processed_cidrs
-        self.static_routes = processed_routes
-
-        self.call_after_refresh(self.update_tables)
-
-    def update_tables(self) -> None:
-        """Populates all DataTables with the loaded data."""
-        # Provider Networks
-        pn_table = self.query_one("#provider_networks_table", DataTable)
-        pn_table.clear()
-        for i, item in enumerate(self.provider_networks):
-            net = item.get("network", {})
-            is_mgmt = "✓" if net.get("is_management_address") else ""
-            groups = ", ".join(net.get("group_binds", []))
-            pn_table.add_row(
-                is_mgmt,
-                net.get("container_bridge", "N/A"),
-                net.get("type", "N/A"),
-                net.get("container_interface", "N/A"),
-                net.get("ip_from_q", "N/A"),
-                groups,
-                key=str(i)
-            )
-
-        # CIDR Networks
-        cn_table = self.query_one("#cidr_networks_table", DataTable)
+        # Format the table cells here too, so the UI thread only has to insert them
+        pn_rows = [_pn_row(item) for item in provider_networks_raw]
+        cn_rows = [_cidr_row(name, data) for name, data in sorted(processed_cidrs.items())]
+        self.app.call_from_thread(
+            self._apply_loaded_config, data, provider_networks_raw, processed_cidrs, pn_rows, cn_rows)
+
+    def _apply_loaded_config(
+            self, data: dict, provider_networks: list, cidr_networks: dict,
+            pn_rows: list[tuple[str, ...]], cn_rows: list[tuple[str, ...]]) -> None:
+        """Install freshly loaded state and fill all tables in a single update."""
+        # The safe-loaded tree is only read from, so it is kept as is rather than deep-copied
+        self.initial_data = data
+        self._initial_used_ips = sorted(data.get("used_ips") or [])
+        # The list is copied so edits never reach initial_data
+        self.provider_networks = list(provider_networks)
+        self.cidr_networks = cidr_networks
+        self.static_routes = _collect_static_routes(provider_networks)
+        self._dirty = self._recompute_dirty()
+
+        with self.app.batch_update():
+            self._populate_provider_networks_table(pn_rows)
+            self._populate_cidr_networks_table(cn_rows)
+            self._populate_static_routes_table()
+
+    def _populate_provider_networks_table(self, rows: list[tuple[str, ...]] | None = None) -> None:
+        """Rebuild the provider networks table from scratch, from pre-formatted rows if given."""
+        if rows is None:
+            rows = [_pn_row(item) for item in self.provider_networks]
+        self._pn_table.clear()
+        self._pn_row_keys = []
+        self._next_pn_key = 0
+        for row in rows:
+            self._add_pn_row(row)
+
+    def _populate_cidr_networks_table(self, rows: list[tuple[str, ...]] | None = None) -> None:
+        """Rebuild the CIDR networks table from scratch, from pre-formatted rows if given."""
+        if rows is None:
+            rows = [_cidr_row(name, data) for name, data in sorted(self.cidr_networks.items())]
+        cn_table = self._cn_table
         cn_table.clear()
-        for name, data in sorted(self.cidr_networks.items()):
-            used_ips_str = ", ".join(data.get("used_ips", []))
-            cn_table.add_row(name, data.get("cidr", "N/A"), used_ips_str, key=name)
+        for row in rows:
+            # The first cell is the network name
+            cn_table.add_row(*row, key=row[0])
 
-        # Static Routes
-        sr_table = self.query_one("#static_routes_table", DataTable)
+    def _populate_static_routes_table(self) -> None:
+        """Rebuild the static routes table from scratch."""
+        sr_table = self._sr_table
         sr_table.clear()
         for i, route in enumerate(self.static_routes):
             sr_table.add_row(
@@ -523,118 +730,141 @@ class NetworkScreen(WizardConfigScreen):
                 key=str(i)
             )
 
-    def watch_cidr_networks(self, _: dict) -> None:
-        """When CIDR network data changes, update the table."""
-        if self.is_mounted:
-            self.update_tables()
-
-    def watch_provider_networks(self, new_provider_networks: list) -> None:
-        """When provider network data changes, re-process derived data and update tables."""
-        if self.is_mounted:
-            # Re-process static routes from the updated provider networks
-            processed_routes = []
-            for i, p_net in enumerate(new_provider_networks):
-                net_info = p_net.get("network", {})
-                bridge = net_info.get("container_bridge")
-                if bridge and "static_routes" in net_info:
-                    for route in net_info["static_routes"]:
-                        processed_routes.append({
-                            "network_bridge": bridge,
-                            **route
-                        })
-            self.static_routes = processed_routes
-            self.update_tables()
+    def _add_pn_row(self, row: tuple[str, ...]) -> None:
+        """Append a provider network row under a key that stays stable across deletions."""
+        key = str(self._next_pn_key)
+        self._next_pn_key += 1
+        self._pn_row_keys.append(key)
+        self._pn_table.add_row(*row, key=key)
+
+    def _pn_index(self, row_key: str) -> int:
+        """Map a provider network row key to its index in provider_networks."""
+        return self._pn_row_keys.index(row_key)
+
+    def _sync_static_routes(self) -> None:
+        """Re-derive static routes and rebuild their table only when they changed."""
+        routes = _collect_static_routes(self.provider_networks)
+        if routes != self.static_routes:
+            self.static_routes = routes
+            self._populate_static_routes_table()
+
+    def _update_pn_row(self, row_key: str, item: dict) -> None:
+        """Refresh the cells of a single provider network row."""
+        pn_table = self._pn_table
+        for column_key, value in zip(self._pn_columns, _pn_row(item)):
+            pn_table.update_cell(row_key, column_key, value)
+
+    def _store_cidr(self, name: str, data: dict) -> None:
+        """Add or replace a CIDR network, touching only its own table row."""
+        cn_table = self._cn_table
+        is_new = name not in self.cidr_networks
+        # cidr_networks is built by this screen at load time, so it is edited in place
+        self.cidr_networks[name] = data
+        self._dirty = True
+        if is_new:
+            cn_table.add_row(*_cidr_row(name, data), key=name)
+            # Keep the table ordered by name, as a full rebuild would
+            cn_table.sort(self._cn_columns[0])
+        else:
+            for column_key, value in zip(self._cn_columns, _cidr_row(name, data)):
+                cn_table.update_cell(name, column_key, value)
 
     @on(DataTable.RowSelected, "#cidr_networks_table")
     def on_cidr_row_selected(self, event: DataTable.RowSelected) -> None:
-        """Handle CIDR table row selection to enable buttons and detect double-clicks."""
-        edit_cidr_button = self.query_one("#edit_cidr_button", Button)
-        edit_cidr_button.disabled = False
-        edit_cidr_button.display = True
-        delete_cidr_button = self.query_one("#delete_cidr_button", Button)
-        delete_cidr_button.disabled = False
-        delete_cidr_button.display = True
+        """Handle CIDR table row selection to enable buttons."""
+        self._edit_cidr_button.disabled = False
+        self._edit_cidr_button.display = True
+        self._delete_cidr_button.disabled = False
+        self._delete_cidr_button.display = True
         self.selected_cidr_key = event.row_key
 
-        current_time = time.time()
-        if (current_time - self._last_cidr_row_click_time < 0.5) and (event.row_key == self._last_clicked_cidr_row_key):
-            self.action_edit_cidr(self.selected_cidr_key.value)
-            self._last_cidr_row_click_time = 0.0  # Reset to prevent triple-click
-        else:
-            self._last_cidr_row_click_time = current_time
-            self._last_clicked_cidr_row_key = event.row_key
+    @on(DoubleClickDataTable.RowDoubleClicked, "#cidr_networks_table")
+    def on_cidr_row_double_clicked(self, event: DoubleClickDataTable.RowDoubleClicked) -> None:
+        """Open the CIDR editor on a double-click."""
+        self.action_edit_cidr(event.row_key.value)
 
     @on(DataTable.HeaderSelected, "#cidr_networks_table")
     def on_cidr_header_selected(self, event: DataTable.HeaderSelected) -> None:
         """Handle clearing selection in the CIDR table."""
-        edit_cidr_button = self.query_one("#edit_cidr_button", Button)
-        edit_cidr_button.disabled = True
-        edit_cidr_button.display = False
-        delete_cidr_button = self.query_one("#delete_cidr_button", Button)
-        delete_cidr_button.disabled = True
-        delete_cidr_button.display = False
+        self._edit_cidr_button.disabled = True
+        self._edit_cidr_button.display = False
+        self._delete_cidr_button.disabled = True
+        self._delete_cidr_button.display = False
         self.selected_cidr_key = None
 
     @on(DataTable.RowSelected, "#provider_networks_table")
     def on_pn_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle Provider Network table row selection."""
-        edit_provider_net_button = self.query_one("#edit_provider_net_button", Button)
-        edit_provider_net_button.disabled = False
-        edit_provider_net_button.display = True
-        delete_provider_net_button = self.query_one("#delete_provider_net_button", Button)
-        delete_provider_net_button.disabled = False
-        delete_provider_net_button.display = True
+        self._edit_pn_button.disabled = False
+        self._edit_pn_button.display = True
+        self._delete_pn_button.disabled = False
+        self._delete_pn_button.display = True
         self.selected_pn_key = event.row_key.value
 
-        current_time = time.time()
-        if (current_time - self._last_pn_row_click_time < 0.5) and (event.row_key == self._last_clicked_pn_row_key):
-            self.action_edit_provider_network()
-            self._last_pn_row_click_time = 0.0
-        else:
-            self._last_pn_row_click_time = current_time
-            self._last_clicked_pn_row_key = event.row_key
+    @on(DoubleClickDataTable.RowDoubleClicked, "#provider_networks_table")
+    def on_pn_row_double_clicked(self, event: DoubleClickDataTable.RowDoubleClicked) -> None:
+        """Open the Provider Network editor on a double-click."""
+        # The RowSelected of the same click has already selected this row
+        self.action_edit_provider_network()
 
     @on(DataTable.HeaderSelected, "#provider_networks_table")
     def on_pn_header_selected(self, event: DataTable.HeaderSelected) -> None:
         """Handle clearing selection in the Provider Network table."""
-        edit_provider_net_button = self.query_one("#edit_provider_net_button", Button)
-        edit_provider_net_button.disabled = True
-        edit_provider_net_button.display = False
-        delete_provider_net_button = self.query_one("#delete_provider_net_button", Button)
-        delete_provider_net_button.disabled = True
-        delete_provider_net_button.display = False
+        self._edit_pn_button.disabled = True
+        self._edit_pn_button.display = False
+        self._delete_pn_button.disabled = True
+        self._delete_pn_button.display = False
         self.selected_pn_key = None
 
     @on(DataTable.RowSelected, "#static_routes_table")
     def on_sr_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle Static Route table row selection."""
-        edit_button = self.query_one("#edit_static_route_button", Button)
-        edit_button.disabled = False
-        edit_button.display = True
-        delete_button = self.query_one("#delete_static_route_button", Button)
-        delete_button.disabled = False
-        delete_button.display = True
+        self._edit_sr_button.disabled = False
+        self._edit_sr_button.display = True
+        self._delete_sr_button.disabled = False
+        self._delete_sr_button.display = True
         self.selected_sr_key = event.row_key.value
 
-        current_time = time.time()
-        if (current_time - self._last_sr_row_click_time < 0.5) and (event.row_key == self._last_clicked_sr_row_key):
-            self.action_edit_static_route()
-            self._last_sr_row_click_time = 0.0
-        else:
-            self._last_sr_row_click_time = current_time
-            self._last_clicked_sr_row_key = event.row_key
+    @on(DoubleClickDataTable.RowDoubleClicked, "#static_routes_table")
+    def on_sr_row_double_clicked(self, event: DoubleClickDataTable.RowDoubleClicked) -> None:
+        """Open the Static Route editor on a double-click."""
+        self.action_edit_static_route()
 
     @on(DataTable.HeaderSelected, "#static_routes_table")
     def on_sr_header_selected(self, event: DataTable.HeaderSelected) -> None:
         """Handle clearing selection in the Static Route table."""
-        edit_button = self.query_one("#edit_static_route_button", Button)
-        edit_button.disabled = True
-        edit_button.display = False
-        delete_button = self.query_one("#delete_static_route_button", Button)
-        delete_button.disabled = True
-        delete_button.display = False
+        self._edit_sr_button.disabled = True
+        self._edit_sr_button.display = False
+        self._delete_sr_button.disabled = True
+        self._delete_sr_button.display = False
         self.selected_sr_key = None
 
+    def _provider_network_modal(self, **kwargs) -> AddEditProviderNetworkScreen:
+        """Return the provider network modal, installed so Textual keeps it composed between uses."""
+        if self._pn_modal is None:
+            self._pn_modal = AddEditProviderNetworkScreen(**kwargs)
+            self.app.install_screen(self._pn_modal, _PN_MODAL_NAME)
+        else:
+            self._pn_modal.reset(**kwargs)
+        return self._pn_modal
+
+    def _cidr_network_modal(self, **kwargs) -> AddEditCidrNetworkScreen:
+        """Return the CIDR network modal, installed so Textual keeps it composed between uses."""
+        if self._cidr_modal is None:
+            self._cidr_modal = AddEditCidrNetworkScreen(**kwargs)
+            self.app.install_screen(self._cidr_modal, _CIDR_MODAL_NAME)
+        else:
+            self._cidr_modal.reset(**kwargs)
+        return self._cidr_modal
+
+    def on_unmount(self) -> None:
+        """Release the reused modals along with the screen."""
+        for modal in (self._pn_modal, self._cidr_modal):
+            # On app exit a modal can still be open; the app then tears it down itself
+            if modal is not None and modal not in self.app.screen_stack:
+                self.app.uninstall_screen(modal)
+                modal.remove()
+
     @on(Button.Pressed, "#add_provider_net_button")
     @work
     async def action_add_provider_network(self) -> None:
@@ -646,16 +876,18 @@ class NetworkScreen(WizardConfigScreen):
             if p.get('network', {}).get('container_interface')
         ]
         is_management_set = any(p.get('network', {}).get('is_management_address') for p in self.provider_networks)
-        new_net_info = await self.app.push_screen_wait(AddEditProviderNetworkScreen(
+        new_net_info = await self.app.push_screen_wait(self._provider_network_modal(
             cidr_options=cidr_options,
             existing_interfaces=existing_interfaces,
             is_management_network_set=is_management_set
         ))
 
         if new_net_info:
-            current_nets = self.provider_networks.copy()
-            current_nets.append(new_net_info)
-            self.provider_networks = current_nets
+            # provider_networks is owned by this screen, so it is edited in place
+            self.provider_networks.append(new_net_info)
+            self._dirty = True
+            self._add_pn_row(_pn_row(new_net_info))
+            self._sync_static_routes()
 
     @on(Button.Pressed, "#edit_provider_net_button")
     @work
@@ -664,7 +896,8 @@ class NetworkScreen(WizardConfigScreen):
         if self.selected_pn_key is None:
             return
 
-        index = int(self.selected_pn_key)
+        row_key = self.selected_pn_key
+        index = self._pn_index(row_key)
         network_to_edit = self.provider_networks[index]
         cidr_options = list(self.cidr_networks.keys())
         existing_interfaces = [
@@ -678,14 +911,15 @@ class NetworkScreen(WizardConfigScreen):
         )
 
         updated_net_info = await self.app.push_screen_wait(
-            AddEditProviderNetworkScreen(cidr_options=cidr_options, existing_interfaces=existing_interfaces,
+            self._provider_network_modal(cidr_options=cidr_options, existing_interfaces=existing_interfaces,
                                          network_data=network_to_edit,
                                          is_management_network_set=is_management_set_elsewhere,)
         )
         if updated_net_info:
-            current_nets = self.provider_networks.copy()
-            current_nets[index] = updated_net_info
-            self.provider_networks = current_nets
+            self.provider_networks[index] = updated_net_info
+            self._dirty = True
+            self._update_pn_row(row_key, updated_net_info)
+            self._sync_static_routes()
 
     @on(Button.Pressed, "#delete_provider_net_button")
     @work
@@ -694,33 +928,31 @@ class NetworkScreen(WizardConfigScreen):
         if self.selected_pn_key is None:
             return
 
-        index = int(self.selected_pn_key)
+        row_key = self.selected_pn_key
+        index = self._pn_index(row_key)
         net_bridge = self.provider_networks[index].get('network', {}).get('container_bridge', f"at index {index}")
         message = f"Delete provider network '{net_bridge}'?"
-        confirmed = await self.app.push_screen_wait(ConfirmExitScreen(message=message))
+        confirmed = await self.app.push_screen_wait(self._confirm_exit_modal(message))
         if confirmed:
-            current_nets = self.provider_networks.copy()
-            current_nets.pop(index)
-            self.provider_networks = current_nets
+            del self.provider_networks[index]
+            self._dirty = True
+            self._pn_table.remove_row(row_key)
+            del self._pn_row_keys[index]
+            self._sync_static_routes()
             # After deletion, clear the selection state to prevent errors
-            edit_provider_net_button = self.query_one("#edit_provider_net_button", Button)
-            edit_provider_net_button.disabled = True
-            edit_provider_net_button.display = False
-            delete_provider_net_button = self.query_one("#delete_provider_net_button", Button)
-            delete_provider_net_button.disabled = True
-            delete_provider_net_button.display = False
+            self._edit_pn_button.disabled = True
+            self._edit_pn_button.display = False
+            self._delete_pn_button.disabled = True
+            self._delete_pn_button.display = False
             self.selected_pn_key = None
 
     @on(Button.Pressed, "#add_cidr_button")
     @work
     async def on_add_cidr_button_pressed(self) -> None:
         """Show the modal for adding a new CIDR network."""
-        cidr_info = await self.app.push_screen_wait(AddEditCidrNetworkScreen())
+        cidr_info = await self.app.push_screen_wait(self._cidr_network_modal())
         if cidr_info:
-            name, data = cidr_info
-            current_cidrs = self.cidr_networks.copy()
-            current_cidrs[name] = data
-            self.cidr_networks = current_cidrs
+            self._store_cidr(*cidr_info)
 
     @on(Button.Pressed, "#edit_cidr_button")
     def on_edit_cidr_button_pressed(self) -> None:
@@ -740,14 +972,11 @@ class NetworkScreen(WizardConfigScreen):
             return
 
         updated_cidr_info = await self.app.push_screen_wait(
-            AddEditCidrNetworkScreen(cidr_data=(cidr_name, cidr_to_edit))
+            self._cidr_network_modal(cidr_data=(cidr_name, cidr_to_edit))
         )
 
         if updated_cidr_info:
-            name, data = updated_cidr_info
-            current_cidrs = self.cidr_networks.copy()
-            current_cidrs[name] = data
-            self.cidr_networks = current_cidrs
+            self._store_cidr(*updated_cidr_info)
 
     @on(Button.Pressed, "#delete_cidr_button")
     @work
@@ -757,18 +986,16 @@ class NetworkScreen(WizardConfigScreen):
             return
 
         cidr_name = self.selected_cidr_key.value
-        confirmed = await self.app.push_screen_wait(ConfirmExitScreen(f"Delete CIDR network '{cidr_name}'?"))
+        confirmed = await self.app.push_screen_wait(self._confirm_exit_modal(f"Delete CIDR network '{cidr_name}'?"))
         if confirmed:
-            current_cidrs = self.cidr_networks.copy()
-            if current_cidrs.pop(cidr_name, None):
-                self.cidr_networks = current_cidrs
+            if self.cidr_networks.pop(cidr_name, None):
+                self._dirty = True
+                self._cn_table.remove_row(cidr_name)
                 # After deletion, clear the selection state
-                edit_cidr_button = self.query_one("#edit_cidr_button", Button)
-                edit_cidr_button.disabled = True
-                edit_cidr_button.display = False
-                delete_cidr_button = self.query_one("#delete_cidr_button", Button)
-                delete_cidr_button.disabled = True
-                delete_cidr_button.display = False
+                self._edit_cidr_button.disabled = True
+                self._edit_cidr_button.display = False
+                self._delete_cidr_button.disabled = True
+                self._delete_cidr_button.display = False
                 self.selected_cidr_key = None
 
     @on(Button.Pressed, "#add_static_route_button")
@@ -781,7 +1008,7 @@ class NetworkScreen(WizardConfigScreen):
             if p.get("network", {}).get("container_bridge")
         ]
         if not provider_net_options:
-            self.query_one("#status_message").update(
+            self._status_message.update(
                 "[yellow]Cannot add a static route without a provider network.[/yellow]")
             self.app.bell()
             return
@@ -792,15 +1019,15 @@ class NetworkScreen(WizardConfigScreen):
 
         if new_route_info:
             # Find the provider network to add this route to
-            current_nets = copy.deepcopy(self.provider_networks)
-            for p_net in current_nets:
+            for i, p_net in enumerate(self.provider_networks):
                 if p_net.get("network", {}).get("container_bridge") == new_route_info["network_bridge"]:
-                    p_net.setdefault("network", {}).setdefault("static_routes", []).append({
+                    routes = [*p_net.get("network", {}).get("static_routes", []), {
                         "cidr": new_route_info["cidr"],
                         "gateway": new_route_info["gateway"],
-                    })
-                    # Re-assign to trigger the watcher
-                    self.provider_networks = current_nets
+                    }]
+                    self.provider_networks[i] = _with_static_routes(p_net, routes)
+                    self._dirty = True
+                    self._sync_static_routes()
                     break
 
     @on(Button.Pressed, "#edit_static_route_button")
@@ -825,13 +1052,14 @@ class NetworkScreen(WizardConfigScreen):
         if updated_route_info:
             # Find the original route in the provider_networks structure and update it
             # The bridge name is constant, so we use it to find the parent network.
-            current_nets = copy.deepcopy(self.provider_networks)
-            for p_net in current_nets:
+            for i, p_net in enumerate(self.provider_networks):
                 if p_net.get("network", {}).get("container_bridge") == route_to_edit["network_bridge"]:
-                    routes = p_net.get("network", {}).get("static_routes", [])
+                    routes = list(p_net.get("network", {}).get("static_routes", []))
                     routes.remove({"cidr": route_to_edit["cidr"], "gateway": route_to_edit["gateway"]})
                     routes.append({"cidr": updated_route_info["cidr"], "gateway": updated_route_info["gateway"]})
-                    self.provider_networks = current_nets
+                    self.provider_networks[i] = _with_static_routes(p_net, routes)
+                    self._dirty = True
+                    self._sync_static_routes()
                     return
 
     @on(Button.Pressed, "#delete_static_route_button")
@@ -844,25 +1072,24 @@ class NetworkScreen(WizardConfigScreen):
         index = int(self.selected_sr_key)
         route_to_delete = self.static_routes[index]
         message = f"Delete route '{route_to_delete['cidr']}' via '{route_to_delete['gateway']}'?"
-        confirmed = await self.app.push_screen_wait(ConfirmExitScreen(message=message))
+        confirmed = await self.app.push_screen_wait(self._confirm_exit_modal(message))
 
         if confirmed:
-            current_nets = copy.deepcopy(self.provider_networks)
-            for p_net in current_nets:
+            for i, p_net in enumerate(self.provider_networks):
                 if p_net.get("network", {}).get("container_bridge") == route_to_delete["network_bridge"]:
-                    routes_list = p_net.get("network", {}).get("static_routes", [])
+                    routes_list = list(p_net.get("network", {}).get("static_routes", []))
                     routes_list.remove({"cidr": route_to_delete["cidr"], "gateway": route_to_delete["gateway"]})
+                    self.provider_networks[i] = _with_static_routes(p_net, routes_list)
                     break
 
             # After deletion, clear the selection state to prevent errors
-            edit_button = self.query_one("#edit_static_route_button", Button)
-            edit_button.disabled = True
-            edit_button.display = False
-            delete_button = self.query_one("#delete_static_route_button", Button)
-            delete_button.disabled = True
-            delete_button.display = False
+            self._edit_sr_button.disabled = True
+            self._edit_sr_button.display = False
+            self._delete_sr_button.disabled = True
+            self._delete_sr_button.display = False
             self.selected_sr_key = None
-            self.provider_networks = current_nets
+            self._dirty = True
+            self._sync_static_routes()
 
     @on(Button.Pressed, "#save_button")
     def on_save_button_pressed(self) -> None:
@@ -872,7 +1099,7 @@ class NetworkScreen(WizardConfigScreen):
     @work(thread=True)
     def action_save_configs(self) -> None:
         """Saves all network changes back to openstack_user_config.yml."""
-        status_widget = self.query_one("#status_message", Static)
+        status_widget = self._status_message
         status_widget.update("Saving changes...")
 
         if not self.has_unsaved_changes():
@@ -890,10 +1117,7 @@ class NetworkScreen(WizardConfigScreen):
             self.app.bell()
             return
 
-        yaml_parser = YAML()
-        yaml_parser.indent(mapping=2, sequence=4, offset=2)
-        yaml_parser.preserve_quotes = True
-        yaml_parser.explicit_start = True
+        yaml_parser = _round_trip_yaml()
 
         # Reconstruct data from the current UI state
         new_cidrs = {name: data['cidr'] for name, data in self.cidr_networks.items()}
@@ -901,10 +1125,14 @@ class NetworkScreen(WizardConfigScreen):
         for data in self.cidr_networks.values():
             new_used_ips.extend(data['used_ips'])
 
-        # Load the current file content to update it
+        # Parse the file on first save or if it changed on disk, otherwise update the cached document
         try:
-            with self.user_config_file.open('r') as f:
-                config_data = yaml_parser.load(f) or {}
+            stamp = _file_stamp(self.user_config_file)
+            if self._rt_doc is None or stamp != self._rt_stamp:
+                with self.user_config_file.open('r') as f:
+                    self._rt_doc = yaml_parser.load(f) or {}
+                self._rt_stamp = stamp
+            config_data = self._rt_doc
 
             config_data['used_ips'] = new_used_ips
 
@@ -924,6 +1152,8 @@ class NetworkScreen(WizardConfigScreen):
 
             with self.user_config_file.open('w') as f:
                 yaml_parser.dump(config_data, f)
+            self._rt_stamp = _file_stamp(self.user_config_file)
+            self._dirty = False
         except YAMLError as e:
             error_message = str(type(e))
             if "Duplicate merge keys" in str(e) or "DuplicateKeyError" in str(type(e)):
@@ -933,7 +1163,7 @@ class NetworkScreen(WizardConfigScreen):
                     "Please update the file manually to use the modern list syntax, for example:\n\n"
                     r"  <<: \[*anchor1, *anchor2]"
                 )
-            self.query_one("#status_message", Static).update(error_message)
+            self._status_message.update(error_message)
             self.app.bell()
             self.log(f"YAML Error processing {self.user_config_file} for save: {e}")
             return  # Stop the save process
@@ -941,7 +1171,7 @@ class NetworkScreen(WizardConfigScreen):
         except IOError as e:
             error_message = f"IO Error processing {self.user_config_file} for save: {e}"
             self.log(error_message)
-            self.query_one("#status_message", Static).update(error_message)
+            self._status_message.update(error_message)
             return
 
         status_widget.update("[green]Changes saved successfully.[/green]")
@@ -950,27 +1180,41 @@ class NetworkScreen(WizardConfigScreen):
 
     def has_unsaved_changes(self) -> bool:
         """Check if there are any unsaved changes."""
+        return self._dirty
+
+    def _recompute_dirty(self) -> bool:
+        """Compare the current state against the loaded file to tell whether it changed."""
         # If the initial data was empty (e.g., new file), any current data is an unsaved change.
         if not self.initial_data:
             return bool(self.provider_networks or self.cidr_networks)
 
-        # Reconstruct the original format from the current state
+        # initial_data is never mutated after loading, so the managed subtrees are
+        # compared against it directly instead of against patched copies of it.
+        global_overrides = self.initial_data.get("global_overrides")
+        if not isinstance(global_overrides, dict) or "provider_networks" not in global_overrides:
+            return True
+        initial_cidrs = self.initial_data.get("cidr_networks")
+        if not isinstance(initial_cidrs, dict):
+            return True
+
+        # Cheap size checks first; most edits add or remove an entry
+        initial_pn = global_overrides["provider_networks"]
+        if not isinstance(initial_pn, list) or len(initial_pn) != len(self.provider_networks):
+            return True
+        if initial_cidrs.keys() != self.cidr_networks.keys():
+            return True
+        if sum(len(data['used_ips']) for data in self.cidr_networks.values()) != len(self._initial_used_ips):
+            return True
+
+        # Same shape, compare the content
+        if initial_pn != self.provider_networks:
+            return True
         current_cidrs = {name: data['cidr'] for name, data in self.cidr_networks.items()}
+        if initial_cidrs != current_cidrs:
+            return True
+
         current_used_ips = []
         for data in self.cidr_networks.values():
             current_used_ips.extend(data['used_ips'])
-
-        # Create a representation of the current state in the file's format
-        current_data = copy.deepcopy(self.initial_data)
-        current_data["cidr_networks"] = current_cidrs
-        current_data["used_ips"] = sorted(current_used_ips)
-        current_data.setdefault("global_overrides", {})["provider_networks"] = self.provider_networks
-
         # The original data from the file might not be sorted
-        initial_comparable_data = copy.deepcopy(self.initial_data)
-        if "used_ips" in initial_comparable_data and initial_comparable_data["used_ips"] is not None:
-            initial_comparable_data["used_ips"] = sorted(initial_comparable_data["used_ips"])
-        else:
-            initial_comparable_data["used_ips"] = []
-
-        return initial_comparable_data != current_data
+        return sorted(current_used_ips) != self._initial_used_ips
@@ -11,8 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-
-import copy
+import threading
 
 from textual import on, work
 from textual.app import ComposeResult
@@ -24,6 +23,8 @@ from textual.widgets import Button, Checkbox, Footer, Header, Input, Label, Stat
 from openstack_ansible_wizard.common.config import load_service_config, save_service_config
 from openstack_ansible_wizard.common.screens import WizardConfigScreen
 
+_LOADING_MESSAGE = "Loading configuration..."
+
 
 class PKIConfigScreen(ModalScreen):
     """A modal screen to configure PKI settings."""
@@ -118,8 +119,14 @@ class GenericConfigScreen(WizardConfigScreen):
     def __init__(self, config_path: str, name: str | None = None, id: str | None = None, classes: str | None = None):
         super().__init__(name, id, classes)
         self.config_path = config_path
-        self.initial_data = {}
         self.pki_config_data = {}
+        # Set by every edit and cleared on load and save, so has_unsaved_changes needs no comparison
+        self._dirty = False
+        # Set while a load is in flight, so that repeated requests don't duplicate the work
+        self._loading = False
+        # Held by each save from reading the widgets to writing the file
+        self._save_lock = threading.Lock()
+        self._loading_shown = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -151,32 +158,52 @@ class GenericConfigScreen(WizardConfigScreen):
         yield Footer()
 
     def on_mount(self) -> None:
-        self.query_one("#generic_status_message", Static).update("Loading configuration...")
+        # Cache the widgets that loading, saving and change checks read on every call
+        self._status_message = self.query_one("#generic_status_message", Static)
+        self._internal_vip_input = self.query_one("#internal_lb_vip_address", Input)
+        self._external_vip_input = self.query_one("#external_lb_vip_address", Input)
+        self._show_status(_LOADING_MESSAGE)
         self.load_configs()
 
     @work(thread=True)
     def load_configs(self) -> None:
-        status_widget = self.query_one("#generic_status_message")
-        if status_widget.render().plain != "Loading configuration...":
-            status_widget.update("Loading configuration...")
+        if self._loading:
+            return
+        self._loading = True
+        if not self._loading_shown:
+            self._show_status(_LOADING_MESSAGE)
 
         data, error = load_service_config(self.config_path, self.SERVICE_NAME)
         if error:
-            self.query_one("#generic_status_message").update(f"[red]{error}[/red]")
+            self._show_status(f"[red]{error}[/red]")
+            self._loading = False
             return
 
-        self.initial_data = copy.deepcopy(data)
         self.config_data = data
         self._populate_pki_data_from_config()
         self.call_after_refresh(self.update_widgets)
 
     def update_widgets(self) -> None:
         """Populate widgets with loaded data."""
-        status_widget = self.query_one("#generic_status_message")
-        if status_widget.render().plain == "Loading configuration...":
-            status_widget.update("")
-        self.query_one("#internal_lb_vip_address", Input).value = self.config_data.get("internal_lb_vip_address", "")
-        self.query_one("#external_lb_vip_address", Input).value = self.config_data.get("external_lb_vip_address", "")
+        if self._loading_shown:
+            self._show_status("")
+        # Filling in loaded values is not an edit
+        with self.prevent(Input.Changed):
+            self._internal_vip_input.value = self.config_data.get("internal_lb_vip_address", "")
+            self._external_vip_input.value = self.config_data.get("external_lb_vip_address", "")
+        self._dirty = False
+        self._loading = False
+
+    @on(Input.Changed, "#internal_lb_vip_address")
+    @on(Input.Changed, "#external_lb_vip_address")
+    def on_vip_address_changed(self) -> None:
+        """Flag edits of the endpoints as unsaved changes."""
+        self._dirty = True
+
+    def _show_status(self, message: str) -> None:
+        """Update the status message, keeping track of whether it is the loading one."""
+        self._status_message.update(message)
+        self._loading_shown = message == _LOADING_MESSAGE
 
     def _populate_pki_data_from_config(self) -> None:
         """Extracts PKI data from loaded config to populate the modal."""
@@ -207,20 +234,27 @@ class GenericConfigScreen(WizardConfigScreen):
             "generate_root_ca": True,
         }
 
-    @work(thread=True)
+    @work(thread=True, group="generic-save")
     @on(Button.Pressed, "#save_button")
     def action_save_configs(self) -> None:
         """Saves all changes back to the user config file."""
-        status_widget = self.query_one("#generic_status_message", Static)
-        status_widget.update("Saving...")
+        # Saves run one at a time and read the widgets only once they hold the lock,
+        # so the last one to run always writes the latest values
+        with self._save_lock:
+            self._save_configs()
+
+    def _save_configs(self) -> None:
+        """Writes the current widget values and PKI settings to the wizard config file."""
+        self._show_status("Saving...")
+        saved_state = (self._internal_vip_input.value, self._external_vip_input.value, self.pki_config_data)
 
         new_config = {
-            "internal_lb_vip_address": self.query_one("#internal_lb_vip_address", Input).value,
-            "external_lb_vip_address": self.query_one("#external_lb_vip_address", Input).value,
+            "internal_lb_vip_address": saved_state[0],
+            "external_lb_vip_address": saved_state[1],
         }
 
-        if self.pki_config_data:
-            pki = self.pki_config_data
+        if saved_state[2]:
+            pki = saved_state[2]
             ca_name = pki.get("name")
             if ca_name:
                 # Use the alternate name from the form, or generate a default.
@@ -266,11 +300,13 @@ class GenericConfigScreen(WizardConfigScreen):
 
         try:
             save_service_config(self.config_path, self.SERVICE_NAME, new_config)
-            status_widget.update("[green]Changes saved successfully.[/green]")
-            # Update initial_data to reflect the new saved state
-            self.initial_data = self._get_current_config()
+            self._show_status("[green]Changes saved successfully.[/green]")
+            # Edits made while saving are still unsaved
+            current_state = (self._internal_vip_input.value, self._external_vip_input.value, self.pki_config_data)
+            if current_state == saved_state:
+                self._dirty = False
         except Exception as e:
-            status_widget.update(f"[red]Error saving file: {e}[/red]")
+            self._show_status(f"[red]Error saving file: {e}[/red]")
 
     @work
     @on(Button.Pressed, "#pki_button")
@@ -279,64 +315,13 @@ class GenericConfigScreen(WizardConfigScreen):
         updated_pki_data = await self.app.push_screen_wait(
             PKIConfigScreen(pki_data=self.pki_config_data)
         )
-        if updated_pki_data:
+        if updated_pki_data and updated_pki_data != self.pki_config_data:
             self.pki_config_data = updated_pki_data
-
-    def _get_current_config(self) -> dict:
-        """Gathers current configuration from widgets."""
-        current_config = {
-            "internal_lb_vip_address": self.query_one("#internal_lb_vip_address", Input).value,
-            "external_lb_vip_address": self.query_one("#external_lb_vip_address", Input).value,
-        }
-
-        # Reconstruct the PKI part of the config from the modal's data
-        if self.pki_config_data:
-            pki = self.pki_config_data
-            ca_name = pki.get("name")
-            if ca_name:
-                alt_name = pki.get("alt_name") or f"{ca_name}-alt"
-                authorities = []
-                root_ca = {
-                    "name": ca_name, "provider": "selfsigned", "basic_constraints": "CA:TRUE",
-                    "cn": pki.get("cn"), "email_address": pki.get("email"),
-                    "country_name": pki.get("country"), "state_or_province_name": pki.get("state"),
-                    "organization_name": pki.get("org"), "organizational_unit_name": pki.get("unit"),
-                    "key_usage": ["digitalSignature", "cRLSign", "keyCertSign"], "not_after": "+3650d",
-                }
-                intermediate_ca = {
-                    "name": alt_name, "provider": "ownca", "basic_constraints": "CA:TRUE,pathlen:0",
-                    "cn": pki.get("alt_cn") or f"{pki.get('org')} Intermediate CA", "email_address": pki.get("email"),
-                    "country_name": pki.get("country"), "state_or_province_name": pki.get("state"),
-                    "organization_name": pki.get("org"), "organizational_unit_name": "Intermediate CA",
-                    "key_usage": ["digitalSignature", "cRLSign", "keyCertSign"], "not_after": "+3650d",
-                    "signed_by": ca_name,
-                }
-                if pki.get("generate_root_ca"):
-                    authorities.append(root_ca)
-                authorities.append(intermediate_ca)
-
-                current_config["openstack_pki_authorities"] = authorities
-                current_config["openstack_pki_install_ca"] = [ca_name] if pki.get("generate_root_ca") else []
-                current_config["openstack_pki_service_intermediate_cert_name"] = alt_name
-
-        return current_config
+            self._dirty = True
 
     def has_unsaved_changes(self) -> bool:
         """Check if there are any unsaved changes."""
-        if not self.initial_data:
-            return False
-
-        # Get the full current state from the UI
-        current_state = self._get_current_config()
-
-        # Compare only the keys managed by this screen
-        managed_keys = self.get_managed_keys()
-        for key in managed_keys:
-            # Use .get() with a default to handle cases where a key might not exist in one dictionary
-            if current_state.get(key) != self.initial_data.get(key):
-                return True
-
-        return False
+        return self._dirty
 
     @classmethod
     def get_managed_keys(cls) -> set[str]:
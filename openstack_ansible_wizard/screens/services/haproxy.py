@@ -29,6 +29,8 @@ from textual.widgets import (Button, Checkbox, DataTable, Footer, Header, Input,
 from openstack_ansible_wizard.common.config import load_service_config, save_service_config
 from openstack_ansible_wizard.common.screens import WizardConfigScreen
 
+_LOADING_MESSAGE = "Loading configuration..."
+
 
 class AddEditBindingScreen(ModalScreen):
     """A modal screen to add or edit an HAProxy binding."""
@@ -152,6 +154,7 @@ class HAProxyConfigScreen(WizardConfigScreen):
         self.config_path = config_path
         self.initial_data = {}
         self.selected_binding_key: str | None = None
+        self._loading_shown = False
         # For handling double-clicks on the bindings table
         self._last_row_click_time = 0.0
         self._last_clicked_row_key = None
@@ -219,14 +222,14 @@ class HAProxyConfigScreen(WizardConfigScreen):
         self.query_one("#delete_binding", Button).display = False
         self.query_one("#edit_binding", Button).display = False
         self.query_one("#main_config_container").display = False
-        self.query_one("#haproxy_status_message").update("Loading configuration...")
+        self._show_status(_LOADING_MESSAGE)
         self.load_configs()
 
     @work(thread=True)
     def load_configs(self) -> None:
         data, error = load_service_config(self.config_path, self.SERVICE_NAME)
         if error:
-            self.query_one("#haproxy_status_message").update(f"[red]{error}[/red]")
+            self._show_status(f"[red]{error}[/red]")
             return
 
         self.initial_data = copy.deepcopy(data)
@@ -251,12 +254,16 @@ class HAProxyConfigScreen(WizardConfigScreen):
         self.update_bindings_table()
 
         # Clear loading message and show the main content
-        status_widget = self.query_one("#haproxy_status_message")
-        if status_widget.render().plain == "Loading configuration...":
-            status_widget.update("")
+        if self._loading_shown:
+            self._show_status("")
 
         self.query_one("#main_config_container").display = True
 
+    def _show_status(self, message: str) -> None:
+        """Update the status message, keeping track of whether it is the loading one."""
+        self.query_one("#haproxy_status_message", Static).update(message)
+        self._loading_shown = message == _LOADING_MESSAGE
+
     def update_bindings_table(self) -> None:
         """Refreshes only the bindings table and related buttons."""
         table = self.query_one("#haproxy_bindings_table", DataTable)
@@ -360,8 +367,7 @@ class HAProxyConfigScreen(WizardConfigScreen):
     @on(Button.Pressed, "#save_button")
     def action_save_configs(self) -> None:
         """Saves all changes back to the user config file."""
-        status_widget = self.query_one("#haproxy_status_message", Static)
-        status_widget.update("Saving...")
+        self._show_status("Saving...")
 
         # Gather data from widgets
         new_config = {
@@ -381,7 +387,7 @@ class HAProxyConfigScreen(WizardConfigScreen):
                 if int_cidr:
                     ipaddress.ip_network(int_cidr, strict=False)
             except ValueError as e:
-                status_widget.update(f"[red]Invalid CIDR: {e}[/red]")
+                self._show_status(f"[red]Invalid CIDR: {e}[/red]")
                 return
 
             new_config["haproxy_keepalived_external_vip_cidr"] = ext_cidr
@@ -393,7 +399,7 @@ class HAProxyConfigScreen(WizardConfigScreen):
 
         lxc_config, error = self._get_haproxy_lxc_config(new_config["haproxy_in_lxc"])
         if error:
-            status_widget.update(error)
+            self._show_status(error)
             return
         new_config.update(lxc_config)
 
@@ -405,10 +411,10 @@ class HAProxyConfigScreen(WizardConfigScreen):
         try:
             # The new function handles directory creation and saving
             save_service_config(self.config_path, self.SERVICE_NAME, new_config)
-            status_widget.update("[green]Changes saved successfully.[/green]")
+            self._show_status("[green]Changes saved successfully.[/green]")
             self.load_configs()
         except (YAMLError, IOError) as e:
-            status_widget.update(f"[red]Error saving file: {e}[/red]")
+            self._show_status(f"[red]Error saving file: {e}[/red]")
 
     def _get_haproxy_lxc_config(self, is_in_lxc: bool) -> tuple[dict, str | None]:
         """Manages configs related to running HAProxy in an LXC container.